@@ -0,0 +1,36 @@
+# cython: language_level=3
+"""
+Optional compiled fast path for count_files.py.
+
+Deduplicates and sorts file paths from a list of file lists with the hot
+loop running in C instead of the CPython eval loop. Build in place with:
+
+    cythonize -i scripts/_count_files.pyx
+
+count_files.py automatically falls back to the pure-Python implementation
+when this module has not been built, so building it is never required.
+"""
+
+
+cpdef list unique_sorted(list file_lists):
+    """Return the sorted unique paths across all sublists."""
+    cdef set all_files = set()
+    cdef list sublist
+    cdef Py_ssize_t i, j, n, m
+
+    n = len(file_lists)
+    for i in range(n):
+        entry = file_lists[i]
+        if entry is None:
+            continue
+        if isinstance(entry, list):
+            sublist = <list>entry
+            m = len(sublist)
+            for j in range(m):
+                all_files.add(sublist[j])
+        elif isinstance(entry, str):
+            all_files.add(entry)
+
+    cdef list out = list(all_files)
+    out.sort()
+    return out
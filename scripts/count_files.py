@@ -14,49 +14,264 @@ Usage:
     EOF
 
 Output:
-    {
-      "count": 4,
-      "files": ["file1.php", "file2.php", "file3.php", "file4.php"]
-    }
+    {"count":4,"files":["file1.php","file2.php","file3.php","file4.php"]}
+
+Pass --pretty for indented, human-readable output.
 """
 
+import io
+import os
 import sys
 import json
+import argparse
+import itertools
+import concurrent.futures
+
+_PARSE_ERRORS = (json.JSONDecodeError,)
+
+try:
+    import ijson  # Optional: enables streaming parse of large inputs
+    _PARSE_ERRORS += (ijson.JSONError,)
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster parse/serialize for string-heavy docs
+    _PARSE_ERRORS += (orjson.JSONDecodeError,)
+except ImportError:
+    orjson = None
+
+try:
+    import pybloomfilter  # Optional (pybloomfiltermmap3): approximate mode
+except ImportError:
+    pybloomfilter = None
+
+try:
+    # Optional compiled dedup+sort (see _count_files.pyx for build notes)
+    from _count_files import unique_sorted as _unique_sorted_c
+except ImportError:
+    _unique_sorted_c = None
+
+
+def iter_file_lists(stream):
+    """
+    Lazily yield entries of the top-level 'file_lists' array from a JSON
+    byte stream, one entry at a time.
+
+    Peak memory is bounded by the largest single entry instead of the
+    whole document, so deduplication starts before the input is fully read.
+    """
+    yield from ijson.items(stream, 'file_lists.item')
 
 
-def count_unique_files(file_lists):
+# Parallel dedup only pays for itself once the process-spawn and pickling
+# overhead is amortized over enough paths
+_PARALLEL_MIN_PATHS = 10_000
+
+
+def _local_set(chunk):
+    """Dedup one chunk of sublists; runs in a worker process."""
+    return set(itertools.chain.from_iterable(
+        file_list if type(file_list) is list
+        else (file_list,) if type(file_list) is str
+        else ()
+        for file_list in chunk if file_list
+    ))
+
+
+def _dedup_parallel(file_lists):
+    """
+    Dedup sublists across worker processes and merge via set union.
+
+    Each worker hashes its chunk into a local set outside the GIL; the
+    main process only pays for the union of the already-deduplicated
+    results.
+    """
+    workers = os.cpu_count() or 1
+    chunk_size = -(-len(file_lists) // workers)  # Ceiling division
+    chunks = [file_lists[i:i + chunk_size]
+              for i in range(0, len(file_lists), chunk_size)]
+    merged = set()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for local in pool.map(_local_set, chunks):
+            merged |= local
+    return merged
+
+
+def count_unique_files(file_lists, sort=True):
     """
     Count unique files across multiple search results.
 
     Args:
-        file_lists: List of lists, where each inner list contains file paths
+        file_lists: Iterable of lists (or single path strings), where each
+                    inner list contains file paths. May be a lazy iterator.
+        sort: When False, skip sorting and return "files": None. Sorting is
+              the dominant cost after dedup (O(N log N) over every unique
+              path), so count-only callers save the whole Timsort pass.
 
     Returns:
-        dict with count and unique files
+        dict with count and unique files (files is None when sort=False)
     """
-    all_files = set()
+    # Compiled fast path: runs the dedup+sort loop entirely in C. Only
+    # applicable when the whole document is in memory (not streaming).
+    if _unique_sorted_c is not None and sort and type(file_lists) is list:
+        files = _unique_sorted_c(file_lists)
+        return {
+            "count": len(files),
+            "files": files
+        }
 
-    for file_list in file_lists:
-        if file_list:  # Handle None or empty lists
-            if isinstance(file_list, list):
-                all_files.update(file_list)
-            elif isinstance(file_list, str):
-                # Single file path
-                all_files.add(file_list)
+    # Single search result: no cross-list dedup to do, just hash one list
+    if (type(file_lists) is list and len(file_lists) == 1
+            and type(file_lists[0]) is list):
+        all_files = set(map(sys.intern, file_lists[0]))
+
+    # Whole-document inputs big enough to amortize process spawning are
+    # deduped in parallel, one local set per worker, merged by union.
+    # (Interning is skipped there: interned strings don't survive pickling
+    # back from workers.)
+    elif (type(file_lists) is list and len(file_lists) > 1
+            and (os.cpu_count() or 1) > 1
+            and sum(len(fl) for fl in file_lists
+                    if isinstance(fl, list)) >= _PARALLEL_MIN_PATHS):
+        all_files = _dedup_parallel(file_lists)
+
+    # Uniform list-of-lists: one C-level union call walks every argument
+    # without per-sublist Python dispatch
+    elif (type(file_lists) is list and file_lists
+            and all(type(fl) is list for fl in file_lists)):
+        all_files = set().union(*(map(sys.intern, fl) for fl in file_lists))
+
+    else:
+        # Flatten everything through chain.from_iterable so the set is
+        # filled by one C-level call instead of a Python-level loop per
+        # sublist. Single path strings are wrapped in 1-tuples; None/empty
+        # entries and unexpected types contribute nothing.
+        # Paths are interned on the way in: the same path repeated across
+        # many sublists (the common case) hashes to one canonical str, so
+        # duplicates are discarded by pointer comparison and the set holds
+        # one copy.
+        # Exact type checks: JSON parsing only ever yields list/str here,
+        # and `type(x) is list` skips isinstance's subclass walk.
+        all_files = set(itertools.chain.from_iterable(
+            map(sys.intern, file_list) if type(file_list) is list
+            else (sys.intern(file_list),) if type(file_list) is str
+            else ()
+            for file_list in file_lists if file_list
+        ))
 
     return {
         "count": len(all_files),
-        "files": sorted(list(all_files))
+        "files": sorted(all_files) if sort else None
     }
 
 
-if __name__ == '__main__':
+def count_unique_files_approximate(file_lists, capacity=10_000_000,
+                                   error_rate=0.001):
+    """
+    Approximate unique-file count using a Bloom filter.
+
+    Stores a few bits per path instead of the full string, cutting memory
+    10-100x versus the exact set on inputs with tens of millions of paths.
+    The count can undercount by the filter's false-positive rate (0.1% by
+    default). No file list is produced in this mode.
+
+    Args:
+        file_lists: Same shape as count_unique_files
+        capacity: Expected number of unique paths (sizing hint)
+        error_rate: Acceptable false-positive probability
+
+    Returns:
+        dict with the approximate count, files=None, approximate=True
+    """
+    bloom = pybloomfilter.BloomFilter(capacity, error_rate)
+    count = 0
+    for file_list in file_lists:
+        if not file_list:  # Handle None or empty lists
+            continue
+        if isinstance(file_list, str):
+            file_list = (file_list,)
+        elif not isinstance(file_list, list):
+            continue
+        for path in file_list:
+            # add() returns True when the element was (probably) present
+            if not bloom.add(path):
+                count += 1
+    return {
+        "count": count,
+        "files": None,
+        "approximate": True
+    }
+
+
+def write_result(result, pretty=False):
+    """
+    Serialize the result to stdout.
+
+    Compact JSON by default (pipe consumers don't need whitespace) through
+    a block-buffered writer, so the encoder skips the indent branch and the
+    output goes out in large writes instead of line-buffered chunks.
+    """
+    if orjson is not None:
+        # orjson emits bytes; write them straight to the byte stream and
+        # skip the utf-8 encode roundtrip entirely
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        sys.stdout.buffer.write(orjson.dumps(result, option=option))
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
+        return
+
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8',
+                           write_through=False)
+    if pretty:
+        json.dump(result, out, indent=2)
+    else:
+        json.dump(result, out, separators=(',', ':'))
+    out.write('\n')
+    out.flush()
+    out.detach()  # Leave sys.stdout.buffer open
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Count unique files across multiple grep/glob result '
+                    'lists (JSON on stdin).')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Pretty-print the JSON output (default: compact)')
+    parser.add_argument('--count-only', action='store_true',
+                        help='Report only the count; skips sorting the paths')
+    parser.add_argument('--approximate', action='store_true',
+                        help='Use a Bloom filter for the count (low memory, '
+                             'no file list, ~0.1%% error; needs '
+                             'pybloomfiltermmap3)')
+    args = parser.parse_args(argv)
+
+    approximate = args.approximate
+    if approximate and pybloomfilter is None:
+        print("warning: --approximate requires pybloomfiltermmap3; "
+              "falling back to exact counting", file=sys.stderr)
+        approximate = False
+
     # Read JSON from stdin
     try:
-        data = json.load(sys.stdin)
-        result = count_unique_files(data.get('file_lists', []))
-        print(json.dumps(result, indent=2))
-    except json.JSONDecodeError as e:
+        if ijson is not None:
+            # Streaming parse: feed file lists into the dedup set as they
+            # arrive instead of materializing the whole document first
+            file_lists = iter_file_lists(sys.stdin.buffer)
+        else:
+            # One syscall-sized read of raw bytes; both parsers decode
+            # utf-8 in a single pass inside C instead of going through the
+            # incremental text-mode wrapper
+            raw = sys.stdin.buffer.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            file_lists = data.get('file_lists', [])
+
+        if approximate:
+            result = count_unique_files_approximate(file_lists)
+        else:
+            result = count_unique_files(file_lists, sort=not args.count_only)
+        write_result(result, pretty=args.pretty)
+    except _PARSE_ERRORS as e:
         print(json.dumps({
             "error": f"Invalid JSON input: {e}",
             "count": 0,
@@ -70,3 +285,7 @@ if __name__ == '__main__':
             "files": []
         }), file=sys.stderr)
         sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
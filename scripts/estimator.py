@@ -8,30 +8,819 @@ ticket estimation based on task type, complexity scoring, and workflow phases.
 All configuration is loaded from heuristics.json.
 """
 
+import os
 import re
+import sys
 import json
 import math
+import types
+import bisect
+import fnmatch
+import functools
+import dataclasses
+import collections
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import ahocorasick  # Optional (pyahocorasick): one-pass keyword scans
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit  # Optional: compiles the numeric kernels below
+except ImportError:
+    njit = None
+
 # Constants
 COMPLEXITY_REFERENCE_POINT = 5.0  # Midpoint of 1-10 complexity scale
 MIN_COMPLEXITY_SCORE = 1
 MAX_COMPLEXITY_SCORE = 10
 DEFAULT_SELF_REVIEW_MINUTES = 30
 
-# Config cache to avoid re-parsing JSON
-_config_cache = {}
+# Static body of the missing-file_count error; built once at import time
+# so only the scope_size is formatted in when the check actually fires
+_FILE_COUNT_ERROR = (
+    f"\n{'=' * 70}\n"
+    "ERROR: High scope_size ({scope_size}/10) detected but file_count is missing!\n"
+    "\n"
+    "File touch overhead will be significantly underestimated.\n"
+    "Please run repository reconnaissance to count affected files:\n"
+    "  - Use Grep/Glob to find all files to be modified\n"
+    "  - Count unique files across all searches\n"
+    "  - Pass file_count parameter to estimate_ticket()\n"
+    "\n"
+    "Impact: For large refactors (50-100+ files), this can add 2-5 hours\n"
+    "to the manual workflow estimate.\n"
+    f"{'=' * 70}\n"
+)
+
+def _standard_manual_kernel(scale_factor, adjusted_complexity, base_unit,
+                            testing_pct, planning_base, code_review_base,
+                            verification_base):
+    """
+    Arithmetic core of the standard manual workflow: scalars in, a tuple
+    of phase times out. No strings or dicts touch this function, so it is
+    jit-compilable as-is when numba is installed.
+    """
+    implementation = adjusted_complexity * base_unit
+    return (planning_base * scale_factor,
+            implementation,
+            implementation * testing_pct,
+            code_review_base * scale_factor,
+            verification_base * scale_factor)
+
+
+def _standard_ai_kernel(planning, implementation, self_review, testing,
+                        scale_factor, planning_keep, impl_keep,
+                        hr_self_review_pct, hr_testing_pct, iterations_base):
+    """Arithmetic core of the standard AI-assisted workflow (see above)."""
+    return (planning * planning_keep,
+            implementation * impl_keep,
+            self_review * hr_self_review_pct + testing * hr_testing_pct,
+            iterations_base * scale_factor)
+
+
+if njit is not None:
+    # cache=True persists the compiled kernels across processes; fastmath
+    # is deliberately off so jitted results stay bit-identical to the
+    # pure-Python fallback
+    _standard_manual_kernel = njit(cache=True)(_standard_manual_kernel)
+    _standard_ai_kernel = njit(cache=True)(_standard_ai_kernel)
+
+
+class _ManualParams:
+    """Flattened standard-workflow numbers for one project type."""
+    __slots__ = ('planning_base', 'self_review', 'testing_pct',
+                 'code_review_base', 'deploy_base', 'deploy_infra',
+                 'verification_base', 'scaled_bases')
+
+    def __init__(self, phases):
+        self.planning_base = phases['planning_design']['base_minutes_at_complexity_5']
+        self.self_review = phases['self_review']['base_minutes']
+        self.testing_pct = phases['testing']['percentage_of_implementation'] / 100.0
+        self.code_review_base = phases['code_review']['base_minutes_at_complexity_5']
+        self.deploy_base = phases['deployment_to_test']['base_minutes']
+        self.deploy_infra = phases['deployment_to_test']['infrastructure_changes_minutes']
+        self.verification_base = phases['verification']['base_minutes_at_complexity_5']
+        # Scale-linear phase bases as one contiguous tuple:
+        # (planning, code_review, verification)
+        self.scaled_bases = (self.planning_base, self.code_review_base,
+                             self.verification_base)
+
+
+class _TAManualParams:
+    """Flattened test-automation-workflow numbers."""
+    __slots__ = ('test_planning_base', 'environment_setup_base',
+                 'page_objects_base', 'gherkin_base', 'testing_base',
+                 'documentation_base', 'scaled_bases')
+
+    def __init__(self, phases):
+        self.test_planning_base = phases['test_planning']['base_minutes_at_complexity_5']
+        self.environment_setup_base = phases['environment_setup']['base_minutes_at_complexity_5']
+        self.page_objects_base = phases['page_objects']['base_minutes_at_complexity_5']
+        self.gherkin_base = phases['gherkin_integration']['base_minutes_at_complexity_5']
+        self.testing_base = phases['testing']['base_minutes_at_complexity_5']
+        self.documentation_base = phases['documentation']['base_minutes_at_complexity_5']
+        # Scale-linear phase bases as one contiguous tuple (every phase
+        # except implementation, in schema order)
+        self.scaled_bases = (self.test_planning_base,
+                             self.environment_setup_base,
+                             self.page_objects_base, self.gherkin_base,
+                             self.testing_base, self.documentation_base)
+
+
+class _AIParams:
+    """Flattened standard AI-workflow numbers for one project type.
+
+    Savings percentages are stored as keep-factors (1 - pct/100) so the
+    hot path is a single multiply.
+    """
+    __slots__ = ('planning_keep', 'impl_keep', 'review_base',
+                 'hr_testing_pct', 'hr_self_review_pct', 'iterations_base',
+                 'verif_base', 'verif_infra')
+
+    def __init__(self, ai_phases):
+        self.planning_keep = 1 - ai_phases['ai_planning']['time_savings_percentage'] / 100.0
+        self.impl_keep = 1 - ai_phases['ai_implementation']['time_savings_percentage'] / 100.0
+        self.review_base = ai_phases['ai_review']['base_minutes']
+        self.hr_testing_pct = ai_phases['human_review_testing']['manual_phase_testing_percentage'] / 100.0
+        self.hr_self_review_pct = ai_phases['human_review_testing']['manual_phase_self_review_percentage'] / 100.0
+        self.iterations_base = ai_phases['iterations']['base_minutes_at_complexity_5']
+        self.verif_base = ai_phases['test_verification']['base_minutes']
+        self.verif_infra = ai_phases['test_verification']['infrastructure_changes_minutes']
+
+
+class _TAAIParams:
+    """Flattened test-automation AI-workflow keep-factors."""
+    __slots__ = ('test_planning_keep', 'environment_keep', 'page_objects_keep',
+                 'impl_keep', 'gherkin_keep', 'testing_keep',
+                 'documentation_keep', 'keeps', 'manual_keys')
+
+    def __init__(self, ai_phases):
+        self.test_planning_keep = 1 - ai_phases['ai_test_planning']['time_savings_percentage'] / 100.0
+        self.environment_keep = 1 - ai_phases['ai_environment_setup']['time_savings_percentage'] / 100.0
+        self.page_objects_keep = 1 - ai_phases['ai_page_objects']['time_savings_percentage'] / 100.0
+        self.impl_keep = 1 - ai_phases['ai_implementation']['time_savings_percentage'] / 100.0
+        self.gherkin_keep = 1 - ai_phases['ai_gherkin']['time_savings_percentage'] / 100.0
+        self.testing_keep = 1 - ai_phases['ai_testing']['time_savings_percentage'] / 100.0
+        self.documentation_keep = 1 - ai_phases['ai_documentation']['time_savings_percentage'] / 100.0
+        # Keep-factors and the manual flat keys they apply to, aligned
+        # with the AI schema order
+        self.keeps = (self.test_planning_keep, self.environment_keep,
+                      self.page_objects_keep, self.impl_keep,
+                      self.gherkin_keep, self.testing_keep,
+                      self.documentation_keep)
+        self.manual_keys = ('test_planning', 'environment_setup',
+                            'page_objects', 'implementation',
+                            'gherkin_integration', 'testing',
+                            'documentation')
+
+
+def _make_standard_manual(params):
+    """
+    Build the manual-workflow time closure for one standard project type,
+    with that type's constants bound as cell variables. Returns the phase
+    times in schema order plus the per-call dynamic fields.
+    """
+    planning_base, code_review_base, verification_base = params.scaled_bases
+    self_review = params.self_review
+    testing_pct = params.testing_pct
+    testing_pct_display = params.testing_pct * 100
+    deploy_base = params.deploy_base
+    deploy_infra = params.deploy_infra
+
+    def times(adjusted_complexity, scale_factor, base_unit, impl_fixed,
+              has_infrastructure_changes):
+        if base_unit is None:
+            # Spike - use time-box (middle value); no numeric base unit,
+            # so the implementation time stays outside the kernel
+            implementation = impl_fixed
+            planning = planning_base * scale_factor
+            testing = implementation * testing_pct
+            code_review = code_review_base * scale_factor
+            verification = verification_base * scale_factor
+        else:
+            (planning, implementation, testing, code_review,
+             verification) = _standard_manual_kernel(
+                scale_factor, adjusted_complexity, base_unit, testing_pct,
+                planning_base, code_review_base, verification_base)
+        deploy = deploy_infra if has_infrastructure_changes else deploy_base
+        return ((planning, implementation, self_review, testing,
+                 code_review, deploy, verification),
+                {'implementation': {'task_type_base_unit': base_unit},
+                 'testing':
+                     {'percentage_of_implementation': testing_pct_display},
+                 'deployment_to_test':
+                     {'infrastructure_changes': has_infrastructure_changes}})
+
+    return times
+
+
+def _make_ta_manual(params):
+    """Manual-workflow time closure for the test_automation project type."""
+    scaled_bases = params.scaled_bases
+
+    def times(adjusted_complexity, scale_factor, base_unit, impl_fixed,
+              has_infrastructure_changes):
+        # Phases 1-3 and 5-7 all scale linearly with complexity; phase 4
+        # uses the task type's base unit (or the spike time-box)
+        (test_planning, environment_setup, page_objects,
+         gherkin_integration, testing, documentation) = [
+            base * scale_factor for base in scaled_bases]
+        implementation = (impl_fixed if base_unit is None
+                          else adjusted_complexity * base_unit)
+        return ((test_planning, environment_setup, page_objects,
+                 implementation, gherkin_integration, testing,
+                 documentation),
+                {'implementation': {'task_type_base_unit': base_unit}})
+
+    return times
+
+
+def _make_standard_ai(params):
+    """AI-workflow time closure for one standard project type."""
+    planning_keep = params.planning_keep
+    impl_keep = params.impl_keep
+    review_base = params.review_base
+    hr_self_review_pct = params.hr_self_review_pct
+    hr_testing_pct = params.hr_testing_pct
+    iterations_base = params.iterations_base
+    verif_base = params.verif_base
+    verif_infra = params.verif_infra
+
+    def times(manual_workflow, scale_factor, has_infrastructure_changes):
+        (ai_planning, ai_implementation, human_review_testing,
+         iterations) = _standard_ai_kernel(
+            manual_workflow['planning_design'],
+            manual_workflow['implementation'],
+            manual_workflow['self_review'], manual_workflow['testing'],
+            scale_factor, planning_keep, impl_keep,
+            hr_self_review_pct, hr_testing_pct, iterations_base)
+        verification = (verif_infra if has_infrastructure_changes
+                        else verif_base)
+        return ((ai_planning, ai_implementation, review_base,
+                 human_review_testing, iterations,
+                 manual_workflow['deployment_to_test'], verification),
+                {'test_verification':
+                 {'infrastructure_changes': has_infrastructure_changes}})
+
+    return times
+
+
+def _make_ta_ai(params):
+    """AI-workflow time closure for the test_automation project type."""
+    pairs = tuple(zip(params.manual_keys, params.keeps))
+
+    def times(manual_workflow, scale_factor, has_infrastructure_changes):
+        # Each phase keeps (1 - time_savings_percentage/100) of its
+        # manual counterpart
+        return ([manual_workflow[key] * keep for key, keep in pairs], None)
+
+    return times
+
+
+def _build_keyword_automaton(task_types):
+    """
+    Build an Aho-Corasick automaton over every task type's keywords and
+    exclude keywords, so classify_task_type can find all hits across
+    all task types in one linear scan instead of one regex search per
+    keyword. Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    # A keyword can belong to several task types (include or exclude),
+    # so each automaton word carries the full list of owners
+    word_map = {}
+    for task_key, task_config in task_types.items():
+        for kw in task_config.get('keywords', []):
+            word_map.setdefault(kw.lower(), []).append(
+                (task_key, 'include', kw))
+        for kw in task_config.get('exclude_keywords', []):
+            word_map.setdefault(kw.lower(), []).append(
+                (task_key, 'exclude', kw))
+
+    if not word_map:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for word, owners in word_map.items():
+        automaton.add_word(word, (word, tuple(owners)))
+    automaton.make_automaton()
+    return automaton
+
+
+# One fully-resolved overhead activity: every detection field and filter
+# an enabled activity needs, flattened out of the JSON tree
+_OverheadRec = collections.namedtuple('_OverheadRec', (
+    'activity_key', 'keywords', 'check_files', 'file_re',
+    'applies_task', 'applies_proj', 'group_id', 'template'))
+
+
+class _PreparedConfig:
+    """Parsed config plus every derived lookup table, built once per file."""
+    __slots__ = ('config', '_kw_automaton', '_task_kw_lower',
+                 '_task_exclude_lower', '_overhead_kw_lower',
+                 '_manual_params', '_ai_params', '_weights', '_multiplier',
+                 '_mult_over_100', '_mult_over_500', '_base_unit', '_fib',
+                 '_fib_midpoints', '_tshirt_sizes', '_tshirt_mins',
+                 '_tshirt_uppers', '_impl_fixed', '_manual_schema',
+                 '_ai_schema', '_overhead_file_re', '_overhead_tmpl',
+                 '_overhead_applies_task', '_overhead_applies_proj',
+                 '_overhead_group_of', '_overhead_group_re',
+                 '_task_inc_re', '_task_exc_re', '_task_kw_re',
+                 '_overhead_prepared', '_manual_times', '_ai_times',
+                 '_buckets_sorted', '_buckets_with_zero',
+                 '_thresholds_by_idx', '_fto', '_fto_zero', '_pt_label',
+                 '_tt_label', '_default_project_type',
+                 '_default_team_velocity', '_default_has_infra',
+                 '_impl_phase_key')
+
+
+@functools.lru_cache(maxsize=8)
+def _load_and_prepare(heuristics_file, mtime_ns):
+    """
+    Parse a heuristics file and build every derived table the estimator
+    reads at runtime. Memoized on (path, mtime_ns): long-lived processes
+    creating many TicketEstimator instances pay for JSON parsing and
+    table construction once, while editing the file (new mtime) still
+    takes effect on the next instantiation.
+    """
+    p = _PreparedConfig()
+    with open(heuristics_file, 'r') as f:
+        config = json.load(f)['estimation_config']
+    # Intern the task/project type keys: every derived table below keeps
+    # the interned strings as its keys, so lookups with classified (also
+    # interned) keys hit the pointer-equality fast path
+    config['task_types'] = {sys.intern(k): v
+                            for k, v in config['task_types'].items()}
+    config['project_types'] = {sys.intern(k): v
+                               for k, v in config['project_types'].items()}
+    p.config = config
+    p._kw_automaton = _build_keyword_automaton(config['task_types'])
+
+    # Constant keyword tables, lowered once here instead of re-reading
+    # the JSON tree and re-lowering on every classification call
+    task_types = config['task_types']
+    p._task_kw_lower = {
+        k: tuple(s.lower() for s in v.get('keywords', ()))
+        for k, v in task_types.items()}
+    p._task_exclude_lower = {
+        k: tuple(s.lower() for s in v.get('exclude_keywords', ()))
+        for k, v in task_types.items()}
+    # Combined per-task include/exclude regexes plus per-keyword patterns:
+    # the no-automaton classification path answers "any keyword at all?"
+    # with one C-level scan per task and only confirms individual keywords
+    # for the winning task
+    p._task_inc_re = {
+        k: re.compile('|'.join(r'\b' + re.escape(kw) + r'\b' for kw in kws))
+        if kws else None
+        for k, kws in p._task_kw_lower.items()}
+    p._task_exc_re = {
+        k: re.compile('|'.join(r'\b' + re.escape(kw) + r'\b' for kw in kws))
+        if kws else None
+        for k, kws in p._task_exclude_lower.items()}
+    p._task_kw_re = {
+        k: tuple((kw, re.compile(r'\b' + re.escape(kw) + r'\b'))
+                 for kw in kws)
+        for k, kws in p._task_kw_lower.items()}
+
+    activities = config.get('overhead_activities', {}).get(
+        'activities', {})
+    p._overhead_kw_lower = {
+        k: tuple(s.lower() for s in v.get('detection', {}).get('keywords', ()))
+        for k, v in activities.items()}
+    # Per-activity result templates with all static fields defaulted and
+    # resolved once; matched_keywords/matched_files stay as placeholders
+    # so per-call assignment preserves key order. Applies-to filters as
+    # frozensets: empty stays falsy (no filter), membership is O(1).
+    p._overhead_tmpl = {
+        k: {'activity_key': k,
+            'label': v.get('label', k),
+            'description': v.get('description', ''),
+            'rationale': v.get('rationale', ''),
+            'additional_minutes': v.get('additional_minutes', 0),
+            'matched_keywords': None,
+            'matched_files': None,
+            'notes': v.get('notes', '')}
+        for k, v in activities.items()}
+    p._overhead_applies_task = {
+        k: frozenset(v.get('applies_to_task_types', ()))
+        for k, v in activities.items()}
+    p._overhead_applies_proj = {
+        k: frozenset(v.get('applies_to_project_types', ()))
+        for k, v in activities.items()}
+    # Activities sharing a keyword vocabulary and the same text-field
+    # flags form one group with one combined word-boundary regex, so the
+    # ticket text is scanned once per unique group instead of once per
+    # keyword per activity
+    p._overhead_group_of = {}
+    p._overhead_group_re = {}
+    for k, v in activities.items():
+        detection = v.get('detection', {})
+        kws = p._overhead_kw_lower[k]
+        gid = (frozenset(kws), detection.get('check_title', False),
+               detection.get('check_description', False))
+        if gid not in p._overhead_group_re:
+            p._overhead_group_re[gid] = re.compile(
+                '|'.join(r'\b' + re.escape(kw) + r'\b' for kw in kws)
+            ) if kws else None
+        p._overhead_group_of[k] = gid
+    # Flattened numeric parameters: the workflow calculators read these
+    # as plain attribute loads instead of 4-5 chained dict subscripts
+    # per scalar on every call
+    p._manual_params = {}
+    p._ai_params = {}
+    for pt_key, pt_cfg in config['project_types'].items():
+        if pt_key == 'test_automation':
+            p._manual_params[pt_key] = _TAManualParams(pt_cfg['workflow_phases'])
+            p._ai_params[pt_key] = _TAAIParams(pt_cfg['ai_assisted_workflow'])
+        else:
+            p._manual_params[pt_key] = _ManualParams(pt_cfg['workflow_phases'])
+            p._ai_params[pt_key] = _AIParams(pt_cfg['ai_assisted_workflow'])
+
+    # Per-project-type dispatch closures with that type's constants bound
+    # as cell variables: one dict lookup plus a call replaces the
+    # project-type branch and params-object loads on every workflow
+    # calculation
+    p._manual_times = {}
+    p._ai_times = {}
+    for pt_key in config['project_types']:
+        if pt_key == 'test_automation':
+            p._manual_times[pt_key] = _make_ta_manual(p._manual_params[pt_key])
+            p._ai_times[pt_key] = _make_ta_ai(p._ai_params[pt_key])
+        else:
+            p._manual_times[pt_key] = _make_standard_manual(
+                p._manual_params[pt_key])
+            p._ai_times[pt_key] = _make_standard_ai(p._ai_params[pt_key])
+
+    # Per-task-type scoring tables
+    p._weights = {
+        k: (w['scope_size'], w['technical_complexity'],
+            w['testing_requirements'], w['risk_and_unknowns'],
+            w['dependencies'])
+        for k, w in config['complexity_weights'].items()}
+    p._multiplier = {k: v['complexity_multiplier']
+                     for k, v in task_types.items()}
+    # Fused scoring factors: the /100 weight normalization and the /5
+    # scale-reference division folded into the task multiplier, so the
+    # scoring hot path is one multiply per result instead of chained
+    # divisions. None for time-boxed tasks without a multiplier.
+    p._mult_over_100 = {
+        k: (m / 100.0) if m is not None else None
+        for k, m in p._multiplier.items()}
+    p._mult_over_500 = {
+        k: (m / 500.0) if m is not None else None
+        for k, m in p._multiplier.items()}
+    p._base_unit = {k: v['base_unit_minutes']
+                    for k, v in task_types.items()}
+    # Fibonacci sequence plus the midpoints between consecutive values:
+    # the midpoints partition the number line into nearest-Fibonacci
+    # buckets, so story-point lookup is one binary search
+    fib = sorted(config['story_points']['fibonacci_sequence'])
+    p._fib = fib
+    p._fib_midpoints = [(lo + hi) / 2 for lo, hi in zip(fib, fib[1:])]
+    # T-shirt ranges flattened into parallel sorted-bound lists so the
+    # size lookup is one binary search over the upper bounds
+    tshirt = sorted(config['t_shirt_sizing'].items(),
+                    key=lambda item: item[1]['complexity_range'][0])
+    p._tshirt_sizes = [size for size, _ in tshirt]
+    p._tshirt_mins = [cfg['complexity_range'][0] for _, cfg in tshirt]
+    p._tshirt_uppers = [cfg['complexity_range'][1] for _, cfg in tshirt]
+    # Fixed implementation minutes for time-boxed tasks (middle of the
+    # time-box, in minutes); None for tasks that scale with complexity
+    p._impl_fixed = {}
+    for k, v in task_types.items():
+        if v['base_unit_minutes'] is None:
+            time_box_hours = v.get('time_box_hours', [2])
+            p._impl_fixed[k] = time_box_hours[len(time_box_hours) // 2] * 60
+        else:
+            p._impl_fixed[k] = None
+
+    _build_phase_schemas(p, config)
+
+    # One compiled regex per activity, unioning all of its fnmatch
+    # file patterns; fnmatch.translate produces \Z-anchored patterns,
+    # so match() keeps fnmatch's full-match semantics
+    p._overhead_file_re = {}
+    for k, v in activities.items():
+        patterns = v.get('detection', {}).get('file_patterns', ())
+        p._overhead_file_re[k] = re.compile(
+            '|'.join(f'(?:{fnmatch.translate(pat.lower())})'
+                     for pat in patterns)
+        ) if patterns else None
+
+    # Flattened bucket-rounding, file-touch-overhead and default settings
+    # with config defaults folded in, so the per-call paths read plain
+    # attributes instead of chained dict lookups with .get() fallbacks
+    # Buckets sorted for binary search, with the implicit 0-hour bucket
+    # prepended so bisect_right's index maps straight to the current
+    # bucket; threshold pairs are pre-parsed into an index-aligned tuple
+    # (None where a bucket has no threshold entry)
+    bucket_cfg = config['bucket_rounding']
+    buckets_sorted = sorted(bucket_cfg['buckets_hours'])
+    bucket_thresholds = bucket_cfg['thresholds']
+    p._buckets_sorted = buckets_sorted
+    p._buckets_with_zero = (0, *buckets_sorted)
+    p._thresholds_by_idx = tuple(
+        (t['threshold'], t['next']) if t is not None else None
+        for t in (bucket_thresholds.get(str(b))
+                  for b in p._buckets_with_zero))
+
+    fto_cfg = config.get('file_touch_overhead', {})
+    scaling_cfg = fto_cfg.get('complexity_scaling', {})
+    scaling_thr = scaling_cfg.get('thresholds', {})
+    p._fto = types.SimpleNamespace(
+        enabled=fto_cfg.get('enabled', False),
+        min_files=fto_cfg.get('minimum_files_for_overhead', 20),
+        base_time=fto_cfg.get('base_time_per_file_minutes', 5),
+        max_overhead=fto_cfg.get('maximum_overhead_minutes', 300),
+        scaling_enabled=scaling_cfg.get('enabled', True),
+        low_threshold=scaling_thr.get('low', 3.0),
+        medium_threshold=scaling_thr.get('medium', 6.0),
+        low_mult=scaling_cfg.get('low_complexity_multiplier', 1.0),
+        medium_mult=scaling_cfg.get('medium_complexity_multiplier', 1.5),
+        high_mult=scaling_cfg.get('high_complexity_multiplier', 1.8))
+    # Shared zero-overhead record for calls without a file_count (the
+    # common case); shaped for whichever early-out branch this config
+    # takes, so those calls skip the per-call allocation entirely
+    p._fto_zero = (FileTouchOverhead(True, 0, 0, 0,
+                                     min_files=p._fto.min_files)
+                   if p._fto.enabled else
+                   FileTouchOverhead(False, 0, 0, None))
+
+    defaults = config.get('defaults', {})
+    p._default_project_type = defaults.get('project_type', 'monolithic')
+    p._default_team_velocity = defaults.get('team_velocity', 1.0)
+    p._default_has_infra = defaults.get('has_infrastructure_changes', False)
+
+    p._pt_label = {k: v['label'] for k, v in config['project_types'].items()}
+    p._tt_label = {k: v['label'] for k, v in task_types.items()}
+
+    # Implementation-phase key per project type, resolved from the manual
+    # schema once instead of scanning the phase keys per ticket (same
+    # first-match-wins rule as the old scan)
+    p._impl_phase_key = {}
+    for pt_key, schema in p._manual_schema.items():
+        for _, num_key, _tmpl in schema:
+            if 'implementation' in num_key.lower():
+                p._impl_phase_key[pt_key] = num_key
+                break
+
+    # Flat record list of the enabled activities with every detection
+    # field resolved, so the per-call loop is tuple-field loads with no
+    # trips through the JSON tree (disabled activities never appear)
+    p._overhead_prepared = [
+        _OverheadRec(k,
+                     p._overhead_kw_lower[k],
+                     v.get('detection', {}).get('check_files', False),
+                     p._overhead_file_re[k],
+                     p._overhead_applies_task[k],
+                     p._overhead_applies_proj[k],
+                     p._overhead_group_of[k],
+                     p._overhead_tmpl[k])
+        for k, v in activities.items() if v.get('enabled', False)]
+
+    return p
+
+
+def _build_phase_schemas(p, config):
+    """Build the per-project-type phase schemas for the result builder."""
+    p._manual_schema = {}
+    p._ai_schema = {}
+    for pt_key, pt_cfg in config['project_types'].items():
+        phases = pt_cfg['workflow_phases']
+        ai_phases = pt_cfg['ai_assisted_workflow']
+        if pt_key == 'test_automation':
+            manual_spec = [
+                ('test_planning', '1_test_planning', 'test_planning',
+                 {'scales_with_complexity': True}),
+                ('environment_setup', '2_environment_setup', 'environment_setup',
+                 {'scales_with_complexity': True}),
+                ('page_objects', '3_page_objects', 'page_objects',
+                 {'scales_with_complexity': True}),
+                ('implementation', '4_implementation', 'implementation',
+                 {'scales_with_complexity': True, 'task_type_base_unit': None}),
+                ('gherkin_integration', '5_gherkin_integration', 'gherkin_integration',
+                 {'scales_with_complexity': True}),
+                ('testing', '6_testing', 'testing',
+                 {'scales_with_complexity': True}),
+                ('documentation', '7_documentation', 'documentation',
+                 {'scales_with_complexity': True}),
+            ]
+            ai_spec = [
+                ('ai_test_planning', '1_ai_test_planning', 'ai_test_planning', 'savings'),
+                ('ai_environment_setup', '2_ai_environment_setup', 'ai_environment_setup', 'savings'),
+                ('ai_page_objects', '3_ai_page_objects', 'ai_page_objects', 'savings'),
+                ('ai_implementation', '4_ai_implementation', 'ai_implementation', 'savings'),
+                ('ai_gherkin', '5_ai_gherkin', 'ai_gherkin', 'savings'),
+                ('ai_testing', '6_ai_testing', 'ai_testing', 'savings'),
+                ('ai_documentation', '7_ai_documentation', 'ai_documentation', 'savings'),
+            ]
+        else:
+            manual_spec = [
+                ('planning_design', '1_planning_design', 'planning_design',
+                 {'scales_with_complexity': True}),
+                ('implementation', '2_implementation', 'implementation',
+                 {'scales_with_complexity': True, 'task_type_base_unit': None}),
+                ('self_review', '3_self_review', 'self_review',
+                 {'scales_with_complexity': False}),
+                ('testing', '4_testing', 'testing',
+                 {'percentage_of_implementation': None}),
+                ('code_review', '5_code_review', 'code_review',
+                 {'scales_with_complexity': True}),
+                ('deployment_to_test', '6_deployment_to_test', 'deployment_to_test',
+                 {'infrastructure_changes': None, 'scales_with_complexity': False}),
+                ('verification', '7_verification', 'verification',
+                 {'scales_with_complexity': True}),
+            ]
+            ai_spec = [
+                ('ai_planning', '1_ai_planning', 'ai_planning', 'savings'),
+                ('ai_implementation', '2_ai_implementation', 'ai_implementation', 'savings'),
+                ('ai_review', '3_ai_review', 'ai_review', {}),
+                ('human_review_testing', '4_human_review_testing', 'human_review_testing', {}),
+                ('iterations', '5_iterations', 'iterations',
+                 {'scales_with_complexity': True}),
+                ('deploy_test', '6_deploy_test', 'deploy_test', {}),
+                ('test_verification', '7_test_verification', 'test_verification',
+                 {'infrastructure_changes': None}),
+            ]
+
+        # Materialize phase-entry templates: label/description resolved
+        # once, dynamic fields present as placeholders so per-call
+        # assignment preserves key order
+        p._manual_schema[pt_key] = [
+            (flat_key, num_key,
+             {'label': phases[cfg_key]['label'],
+              'description': phases[cfg_key]['description'],
+              'time_minutes': None, **extras})
+            for flat_key, num_key, cfg_key, extras in manual_spec]
+        p._ai_schema[pt_key] = [
+            (flat_key, num_key,
+             {'label': ai_phases[cfg_key]['label'],
+              'description': ai_phases[cfg_key]['description'],
+              'time_minutes': None,
+              **({'time_savings_percentage':
+                  ai_phases[cfg_key]['time_savings_percentage']}
+                 if extras == 'savings' else extras)})
+            for flat_key, num_key, cfg_key, extras in ai_spec]
+
+
+@dataclasses.dataclass(slots=True)
+class PhaseResult:
+    """
+    One workflow phase held in slotted form.
+
+    References the shared load-time template (label, description, flags)
+    instead of copying it, so constructing a phase is a single slotted
+    allocation; the nested dict shape only materializes when as_dict()
+    runs at the output boundary.
+    """
+
+    template: Dict
+    time_minutes: float
+    extra: Optional[Dict] = None  # Per-call dynamic fields
+    file_touch_overhead: Optional[Dict] = None
+
+    def as_dict(self) -> Dict:
+        """Materialize the phase-entry dict in the original key order."""
+        entry = dict(self.template)
+        entry['time_minutes'] = self.time_minutes
+        if self.extra:
+            entry.update(self.extra)
+        if self.file_touch_overhead is not None:
+            entry['file_touch_overhead'] = self.file_touch_overhead
+        return entry
+
+
+@dataclasses.dataclass(slots=True)
+class WorkflowResult:
+    """
+    A full workflow breakdown held in slotted form.
+
+    flat_times maps flat phase keys to rounded minutes; phases maps the
+    numbered keys to PhaseResult objects. as_dict() produces the exact
+    dict shape the workflow methods have always returned.
+    """
+
+    flat_times: Dict[str, float]
+    total_minutes: float
+    total_hours: float
+    phases: Dict[str, PhaseResult]
+
+    def as_dict(self) -> Dict:
+        """Materialize the flat-times + phases result dict."""
+        result = dict(self.flat_times)
+        result['total_minutes'] = self.total_minutes
+        result['total_hours'] = self.total_hours
+        result['phases'] = {num_key: phase.as_dict()
+                            for num_key, phase in self.phases.items()}
+        return result
+
+
+@dataclasses.dataclass(slots=True)
+class FileTouchOverhead:
+    """
+    File-touch overhead held in slotted form.
+
+    The numeric fields are computed eagerly; the human-readable
+    calculation/details strings are properties that format on access, so
+    callers that only aggregate times never pay for the f-strings.
+    as_dict() reproduces the classic dict shape, including which keys
+    each variant (disabled / below threshold / computed) carries.
+    """
+
+    enabled: bool
+    overhead_minutes: float
+    overhead_hours: float
+    file_count: int
+    base_time_per_file: Optional[float] = None
+    complexity_multiplier: Optional[float] = None
+    complexity_level: Optional[str] = None
+    raw_complexity: Optional[float] = None
+    capped: bool = False
+    maximum_overhead: Optional[float] = None
+    min_files: Optional[int] = None  # Threshold, kept for the details string
+
+    @property
+    def calculation(self) -> Optional[str]:
+        """Human-readable formula; None for the short variants."""
+        if self.complexity_level is None:
+            return None
+        return (f'{self.file_count} files × {self.base_time_per_file} min × '
+                f'{self.complexity_multiplier} = {self.overhead_minutes} min')
+
+    @property
+    def details(self) -> str:
+        """Human-readable summary of the overhead decision."""
+        if not self.enabled:
+            return 'File touch overhead is disabled'
+        if self.complexity_level is None:
+            return f'Below minimum threshold ({self.min_files} files)'
+        return (f'{self.file_count} files with {self.complexity_level} '
+                f'complexity ({self.raw_complexity:.1f}/10)')
+
+    def as_dict(self) -> Dict:
+        """Materialize the overhead dict in the original key order."""
+        if self.complexity_level is None:
+            return {
+                'enabled': self.enabled,
+                'overhead_minutes': self.overhead_minutes,
+                'overhead_hours': self.overhead_hours,
+                'file_count': self.file_count,
+                'details': self.details
+            }
+        return {
+            'enabled': self.enabled,
+            'overhead_minutes': self.overhead_minutes,
+            'overhead_hours': self.overhead_hours,
+            'file_count': self.file_count,
+            'base_time_per_file': self.base_time_per_file,
+            'complexity_multiplier': self.complexity_multiplier,
+            'complexity_level': self.complexity_level,
+            'raw_complexity': self.raw_complexity,
+            'calculation': self.calculation,
+            'capped': self.capped,
+            'maximum_overhead': self.maximum_overhead,
+            'details': self.details
+        }
 
 
 class TicketEstimator:
     """Main estimator class with all calculation logic."""
 
+    # Instances carry exactly the prepared tables plus the estimate
+    # memo: slots replace the per-instance __dict__ with fixed-offset
+    # storage, so the many self.<table> loads on the hot paths skip the
+    # dict lookup
+    __slots__ = _PreparedConfig.__slots__ + ('_estimate_cached',)
+
     def __init__(self, heuristics_file='heuristics.json'):
         """Load configuration from heuristics.json with caching."""
-        if heuristics_file not in _config_cache:
-            with open(heuristics_file, 'r') as f:
-                _config_cache[heuristics_file] = json.load(f)['estimation_config']
-        self.config = _config_cache[heuristics_file]
+        prepared = _load_and_prepare(os.path.abspath(heuristics_file),
+                                     os.stat(heuristics_file).st_mtime_ns)
+        # All tables are immutable at runtime, so instances share them by
+        # reference; local attribute copies keep the hot-path lookups as
+        # plain self.<table> loads
+        for name in _PreparedConfig.__slots__:
+            setattr(self, name, getattr(prepared, name))
+        # Per-instance result memo: webhooks and dashboard refreshes
+        # re-estimate identical tickets, so repeats are O(1) hash hits
+        self._estimate_cached = functools.lru_cache(maxsize=2048)(
+            self._estimate_ticket_impl)
+
+    @staticmethod
+    def _is_word_boundary(text: str, start: int, end: int) -> bool:
+        """Check that text[start:end+1] sits on \\b-style word boundaries."""
+        if start > 0:
+            prev = text[start - 1]
+            if prev.isalnum() or prev == '_':
+                return False
+        if end + 1 < len(text):
+            nxt = text[end + 1]
+            if nxt.isalnum() or nxt == '_':
+                return False
+        return True
 
     def classify_task_type(self, title: str, description: str, issue_type: str = None) -> Tuple[str, List[str]]:
         """
@@ -40,8 +829,6 @@ class TicketEstimator:
         Returns:
             Tuple of (task_type_key, reasons)
         """
-        title_lower = title.lower()
-        desc_lower = description.lower()
         reasons = []
 
         # Check issue type first
@@ -51,29 +838,55 @@ class TicketEstimator:
                     reasons.append(f"Issue type is '{issue_type}'")
                     return task_key, reasons
 
-        # Check keywords for each task type
-        for task_key, task_config in self.config['task_types'].items():
-            keywords = task_config.get('keywords', [])
-            exclude_keywords = task_config.get('exclude_keywords', [])
-
-            # Check if any keyword matches (using word boundaries)
-            keyword_matches = []
-            for keyword in keywords:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, title_lower) or re.search(pattern, desc_lower):
-                    keyword_matches.append(keyword)
-
-            # Check if any exclude keyword matches (using word boundaries)
-            exclude_matches = []
-            for exclude in exclude_keywords:
-                pattern = r'\b' + re.escape(exclude) + r'\b'
-                if re.search(pattern, title_lower) or re.search(pattern, desc_lower):
-                    exclude_matches.append(exclude)
-
-            # If we have keyword matches and no exclude matches, classify
-            if keyword_matches and not exclude_matches:
-                reasons.append(f"Keywords found: {', '.join(keyword_matches)}")
-                return task_key, reasons
+        # One concatenation and one lowercase pass over the combined text;
+        # every keyword test below scans this single haystack instead of
+        # title and description separately. The '\n' joiner is a non-word
+        # character, so word-boundary matches cannot cross the seam.
+        text = (title + '\n' + description).lower()
+
+        # Fast path: one Aho-Corasick pass over the combined text finds all
+        # keyword hits for every task type at once
+        if self._kw_automaton is not None:
+            include_hits = {}
+            exclude_hits = {}
+            for end, (word, owners) in self._kw_automaton.iter(text):
+                # Enforce the same word-boundary semantics as the regex path
+                if not self._is_word_boundary(text, end - len(word) + 1, end):
+                    continue
+                for task_key, kind, kw in owners:
+                    hits = include_hits if kind == 'include' else exclude_hits
+                    hits.setdefault(task_key, set()).add(kw)
+
+            # Same decision logic and ordering as the per-keyword scan
+            for task_key in self.config['task_types']:
+                matched = include_hits.get(task_key)
+                if matched and task_key not in exclude_hits:
+                    keyword_matches = [kw for kw in self._task_kw_lower[task_key]
+                                       if kw in matched]
+                    reasons.append(f"Keywords found: {', '.join(keyword_matches)}")
+                    return task_key, reasons
+
+            reasons.append("No specific keywords found, defaulting to enhancement")
+            return 'enhancement', reasons
+
+        # Check keywords for each task type: the combined include/exclude
+        # regexes answer "any keyword at all?" in one C-level scan each,
+        # and individual keywords are only confirmed for the winning task
+        # (to report them as reasons)
+        for task_key in self.config['task_types']:
+            inc_re = self._task_inc_re[task_key]
+            if inc_re is None or inc_re.search(text) is None:
+                continue
+
+            # Skip if any exclude keyword matches (using word boundaries)
+            exc_re = self._task_exc_re[task_key]
+            if exc_re is not None and exc_re.search(text) is not None:
+                continue
+
+            keyword_matches = [kw for kw, kw_re in self._task_kw_re[task_key]
+                               if kw_re.search(text)]
+            reasons.append(f"Keywords found: {', '.join(keyword_matches)}")
+            return task_key, reasons
 
         # Default to enhancement if uncertain
         reasons.append("No specific keywords found, defaulting to enhancement")
@@ -107,38 +920,41 @@ class TicketEstimator:
                     f"{factor} must be between {MIN_COMPLEXITY_SCORE}-{MAX_COMPLEXITY_SCORE}, got {score}"
                 )
 
-        # Get task-type-specific weights
-        weights = self.config['complexity_weights'][task_type]
+        # Get task-type-specific weights (precomputed 5-tuple)
+        w_scope, w_tech, w_test, w_risk, w_dep = self._weights[task_type]
 
-        # Calculate weighted average (raw complexity)
-        raw_complexity = (
-            scope_score * weights['scope_size'] +
-            technical_score * weights['technical_complexity'] +
-            testing_score * weights['testing_requirements'] +
-            risk_score * weights['risk_and_unknowns'] +
-            dependencies_score * weights['dependencies']
-        ) / 100.0
-
-        # Apply task type multiplier
-        task_config = self.config['task_types'][task_type]
-        multiplier = task_config['complexity_multiplier']
+        # Integer dot product of scores and weights (exact)
+        dot = (
+            scope_score * w_scope +
+            technical_score * w_tech +
+            testing_score * w_test +
+            risk_score * w_risk +
+            dependencies_score * w_dep
+        )
+        raw_complexity = dot / 100.0
 
         # Handle spike which has None multiplier (time-boxed, complexity doesn't scale)
-        if multiplier is None:
+        m100 = self._mult_over_100[task_type]
+        if m100 is None:
             adjusted_complexity = raw_complexity  # No adjustment for spikes
             scale_factor = 1.0  # Fixed scale factor for spikes
         else:
-            adjusted_complexity = raw_complexity * multiplier
-            scale_factor = adjusted_complexity / COMPLEXITY_REFERENCE_POINT
+            # Fused multiplies: (dot/100)*mult and adjusted/5 each collapse
+            # to one multiply by a precomputed constant
+            adjusted_complexity = dot * m100
+            scale_factor = dot * self._mult_over_500[task_type]
 
         return raw_complexity, adjusted_complexity, scale_factor
 
     def get_t_shirt_size(self, adjusted_complexity: float) -> str:
         """Map adjusted complexity to T-shirt size."""
-        for size, config in self.config['t_shirt_sizing'].items():
-            min_val, max_val = config['complexity_range']
-            if min_val <= adjusted_complexity <= max_val:
-                return size
+        # Binary-search the sorted upper bounds, then confirm the value
+        # actually falls inside that range (values between ranges or past
+        # the last upper bound keep defaulting to XL, as before)
+        i = bisect.bisect_left(self._tshirt_uppers, adjusted_complexity)
+        if (i < len(self._tshirt_sizes)
+                and self._tshirt_mins[i] <= adjusted_complexity):
+            return self._tshirt_sizes[i]
         return 'XL'  # Default to XL if over 10
 
     def get_story_points(self, adjusted_complexity: float, team_velocity: float = 1.0) -> int:
@@ -146,19 +962,35 @@ class TicketEstimator:
         # Apply team velocity
         base_points = adjusted_complexity * team_velocity
 
-        # Get Fibonacci sequence
-        fibonacci = self.config['story_points']['fibonacci_sequence']
+        # Find nearest Fibonacci number: binary-search the precomputed
+        # midpoints instead of scanning the whole sequence. bisect_left
+        # sends exact midpoints to the lower neighbor, matching min()'s
+        # first-wins tie-breaking over the ascending sequence.
+        return self._fib[bisect.bisect_left(self._fib_midpoints, base_points)]
+
+    def get_story_points_batch(self,
+                               adjusted_complexities: List[float],
+                               team_velocity: float = 1.0) -> List[int]:
+        """
+        Map a batch of adjusted complexities to Story Points in one call.
 
-        # Find nearest Fibonacci number
-        nearest = min(fibonacci, key=lambda x: abs(x - base_points))
-        return nearest
+        Same nearest-Fibonacci lookup as get_story_points, with the
+        sequence, midpoint table and bisect call hoisted out of the loop
+        for consumers scoring many tickets against one velocity.
+        """
+        fib = self._fib
+        midpoints = self._fib_midpoints
+        bisect_left = bisect.bisect_left
+        return [fib[bisect_left(midpoints, adj * team_velocity)]
+                for adj in adjusted_complexities]
 
     def detect_overhead_activities(self,
                                    title: str,
                                    description: str,
                                    task_type: str,
                                    project_type: str = None,
-                                   files_involved: List[str] = None) -> List[Dict]:
+                                   files_involved: List[str] = None
+                                   ) -> Tuple[List[Dict], float]:
         """
         Detect overhead activities based on keywords and file patterns.
 
@@ -170,83 +1002,118 @@ class TicketEstimator:
             files_involved: List of file paths involved in the change
 
         Returns:
-            List of detected overhead activities with time and rationale
+            Tuple of (detected activities with time and rationale, total
+            additional minutes across them)
         """
-        if 'overhead_activities' not in self.config:
-            return []
+        if not self._overhead_prepared:
+            return [], 0
 
-        overhead_config = self.config['overhead_activities']
         detected = []
+        total_minutes = 0
 
-        for activity_key, activity in overhead_config.get('activities', {}).items():
-            # Skip if not enabled
-            if not activity.get('enabled', False):
-                continue
+        # Lower each field once and join the combined form once; groups
+        # below pick whichever prebuilt string matches their field flags
+        # instead of rebuilding a joined string per group (' ' joiner kept
+        # for compatibility with the original per-activity join)
+        title_lower = title.lower()
+        desc_lower = description.lower()
+        both_lower = title_lower + ' ' + desc_lower
+
+        # Matched-keyword sets resolved so far, keyed by keyword group
+        group_matches = {}
 
+        for rec in self._overhead_prepared:
             # Check if applies to this task type
-            applies_to_task_types = activity.get('applies_to_task_types', [])
-            if applies_to_task_types and task_type not in applies_to_task_types:
+            if rec.applies_task and task_type not in rec.applies_task:
                 continue
 
             # Check if applies to this project type
-            applies_to_project_types = activity.get('applies_to_project_types', [])
-            if applies_to_project_types and project_type and project_type not in applies_to_project_types:
+            if (rec.applies_proj and project_type
+                    and project_type not in rec.applies_proj):
                 continue
 
-            detection = activity.get('detection', {})
-            keywords = detection.get('keywords', [])
-            check_title = detection.get('check_title', False)
-            check_description = detection.get('check_description', False)
-            check_files = detection.get('check_files', False)
-            file_patterns = detection.get('file_patterns', [])
-
-            # Check for keyword matches (using word boundaries)
-            matched_keywords = []
-            text_to_check = ''
-
-            if check_title:
-                text_to_check += ' ' + title.lower()
-            if check_description:
-                text_to_check += ' ' + description.lower()
-
-            # Check text for keywords with word boundaries
-            for keyword in keywords:
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                if re.search(pattern, text_to_check):
-                    matched_keywords.append(keyword)
+            # Check for keyword matches (using word boundaries): one
+            # combined-regex scan per unique (keywords, fields) group. The
+            # per-keyword confirm loop only runs for groups with at least
+            # one hit, and its result is shared by every activity in the
+            # group.
+            gid = rec.group_id
+            matched_set = group_matches.get(gid)
+            if matched_set is None:
+                _, check_title, check_description = gid
+                if check_title:
+                    text_to_check = (both_lower if check_description
+                                     else title_lower)
+                elif check_description:
+                    text_to_check = desc_lower
+                else:
+                    text_to_check = ''
+
+                combined_re = self._overhead_group_re[gid]
+                if combined_re is None or combined_re.search(text_to_check) is None:
+                    matched_set = frozenset()
+                else:
+                    matched_set = {kw for kw in gid[0]
+                                   if re.search(r'\b' + re.escape(kw) + r'\b',
+                                                text_to_check)}
+                group_matches[gid] = matched_set
+
+            # Each activity reports matches in its own keyword order
+            matched_keywords = [kw for kw in rec.keywords if kw in matched_set]
 
             # Check file patterns if files provided
             file_matches = []
-            if check_files and files_involved:
-                import fnmatch
+            if rec.check_files and files_involved and rec.file_re is not None:
                 for file_path in files_involved:
-                    file_lower = file_path.lower()
-                    for pattern in file_patterns:
-                        if fnmatch.fnmatch(file_lower, pattern.lower()):
-                            file_matches.append(file_path)
-                            break
+                    if rec.file_re.match(file_path.lower()):
+                        file_matches.append(file_path)
 
-            # If we found matches, add to detected
+            # If we found matches, add to detected: one dict-spread over
+            # the precomputed template, filling the two per-call fields
+            # (showing up to 3 keywords/files each)
             if matched_keywords or file_matches:
-                detected.append({
-                    'activity_key': activity_key,
-                    'label': activity.get('label', activity_key),
-                    'description': activity.get('description', ''),
-                    'rationale': activity.get('rationale', ''),
-                    'additional_minutes': activity.get('additional_minutes', 0),
-                    'matched_keywords': matched_keywords[:3],  # Show up to 3 keywords
-                    'matched_files': file_matches[:3],  # Show up to 3 files
-                    'notes': activity.get('notes', '')
-                })
-
-        return detected
+                detected.append({**rec.template,
+                                 'matched_keywords': matched_keywords[:3],
+                                 'matched_files': file_matches[:3]})
+                # Fold the reduction into the producing loop so callers
+                # don't re-iterate the list just to sum the minutes
+                total_minutes += rec.template['additional_minutes']
+
+        return detected, total_minutes
+
+    @staticmethod
+    def _build_workflow_result(schema, times, dynamic=None):
+        """
+        Assemble the slotted WorkflowResult shared by every workflow
+        return path.
+
+        Args:
+            schema: Precomputed [(flat_key, numbered_key, template), ...]
+            times: Phase times in schema order, unrounded
+            dynamic: Optional {flat_key: {field: value}} per-call fields
+
+        Returns:
+            WorkflowResult whose as_dict() is shaped exactly like the
+            original hand-built returns
+        """
+        flat_times = {}
+        phases = {}
+        total = 0.0
+        for (flat_key, num_key, template), time in zip(schema, times):
+            time_rounded = round(time, 1)
+            flat_times[flat_key] = time_rounded
+            total += time
+            extra = dynamic.get(flat_key) if dynamic is not None else None
+            phases[num_key] = PhaseResult(template, time_rounded, extra)
+        return WorkflowResult(flat_times, round(total, 1),
+                              round(total / 60.0, 2), phases)
 
     def calculate_manual_workflow_time(self,
                                       project_type: str,
                                       task_type: str,
                                       adjusted_complexity: float,
                                       scale_factor: float,
-                                      has_infrastructure_changes: bool = False) -> Dict[str, float]:
+                                      has_infrastructure_changes: bool = False) -> WorkflowResult:
         """
         Calculate manual development workflow time breakdown based on project type.
 
@@ -269,212 +1136,25 @@ class TicketEstimator:
         7. Integration & Documentation
 
         Returns:
-            Dict with phase times in minutes and total
+            WorkflowResult with phase times in minutes and total
+            (as_dict() gives the classic nested-dict shape)
         """
-        project_config = self.config['project_types'][project_type]
-        task_config = self.config['task_types'][task_type]
-        phases = project_config['workflow_phases']
-
-        # Handle test_automation project type with custom workflow
-        if project_type == 'test_automation':
-            # Phase 1: Analysis & Test Planning (scales with complexity)
-            test_planning_base = phases['test_planning']['base_minutes_at_complexity_5']
-            test_planning_time = test_planning_base * scale_factor
-
-            # Phase 2: Environment & Framework Setup (scales with complexity)
-            environment_setup_base = phases['environment_setup']['base_minutes_at_complexity_5']
-            environment_setup_time = environment_setup_base * scale_factor
-
-            # Phase 3: Page Objects & Locators (scales with complexity)
-            page_objects_base = phases['page_objects']['base_minutes_at_complexity_5']
-            page_objects_time = page_objects_base * scale_factor
-
-            # Phase 4: Step Implementations & Business Logic (task-type-specific)
-            base_unit = task_config['base_unit_minutes']
-            if base_unit is None:  # Spike - use time-box
-                time_box_hours = task_config.get('time_box_hours', [2])
-                # Use middle value from time-box
-                implementation_time = time_box_hours[len(time_box_hours) // 2] * 60
-            else:
-                implementation_time = adjusted_complexity * base_unit
-
-            # Phase 5: Step Definitions & Gherkin Integration (scales with complexity)
-            gherkin_integration_base = phases['gherkin_integration']['base_minutes_at_complexity_5']
-            gherkin_integration_time = gherkin_integration_base * scale_factor
-
-            # Phase 6: Testing & Evidence Collection (scales with complexity)
-            testing_base = phases['testing']['base_minutes_at_complexity_5']
-            testing_time = testing_base * scale_factor
-
-            # Phase 7: Integration & Documentation (scales with complexity)
-            documentation_base = phases['documentation']['base_minutes_at_complexity_5']
-            documentation_time = documentation_base * scale_factor
-
-            # Total
-            total_minutes = (test_planning_time + environment_setup_time + page_objects_time +
-                            implementation_time + gherkin_integration_time + testing_time + documentation_time)
-
-            return {
-                'test_planning': round(test_planning_time, 1),
-                'environment_setup': round(environment_setup_time, 1),
-                'page_objects': round(page_objects_time, 1),
-                'implementation': round(implementation_time, 1),
-                'gherkin_integration': round(gherkin_integration_time, 1),
-                'testing': round(testing_time, 1),
-                'documentation': round(documentation_time, 1),
-                'total_minutes': round(total_minutes, 1),
-                'total_hours': round(total_minutes / 60.0, 2),
-                'phases': {
-                    '1_test_planning': {
-                        'label': phases['test_planning']['label'],
-                        'description': phases['test_planning']['description'],
-                        'time_minutes': round(test_planning_time, 1),
-                        'scales_with_complexity': True
-                    },
-                    '2_environment_setup': {
-                        'label': phases['environment_setup']['label'],
-                        'description': phases['environment_setup']['description'],
-                        'time_minutes': round(environment_setup_time, 1),
-                        'scales_with_complexity': True
-                    },
-                    '3_page_objects': {
-                        'label': phases['page_objects']['label'],
-                        'description': phases['page_objects']['description'],
-                        'time_minutes': round(page_objects_time, 1),
-                        'scales_with_complexity': True
-                    },
-                    '4_implementation': {
-                        'label': phases['implementation']['label'],
-                        'description': phases['implementation']['description'],
-                        'time_minutes': round(implementation_time, 1),
-                        'scales_with_complexity': True,
-                        'task_type_base_unit': base_unit
-                    },
-                    '5_gherkin_integration': {
-                        'label': phases['gherkin_integration']['label'],
-                        'description': phases['gherkin_integration']['description'],
-                        'time_minutes': round(gherkin_integration_time, 1),
-                        'scales_with_complexity': True
-                    },
-                    '6_testing': {
-                        'label': phases['testing']['label'],
-                        'description': phases['testing']['description'],
-                        'time_minutes': round(testing_time, 1),
-                        'scales_with_complexity': True
-                    },
-                    '7_documentation': {
-                        'label': phases['documentation']['label'],
-                        'description': phases['documentation']['description'],
-                        'time_minutes': round(documentation_time, 1),
-                        'scales_with_complexity': True
-                    }
-                }
-            }
-
-        # Standard workflow for other project types
-        # Phase 1: Planning & Design (scales with complexity)
-        planning_base = phases['planning_design']['base_minutes_at_complexity_5']
-        planning_time = planning_base * scale_factor
-
-        # Phase 2: Implementation (task-type-specific base unit × adjusted complexity)
-        base_unit = task_config['base_unit_minutes']
-        if base_unit is None:  # Spike - use time-box
-            time_box_hours = task_config.get('time_box_hours', [2])
-            # Use middle value from time-box
-            implementation_time = time_box_hours[len(time_box_hours) // 2] * 60
-        else:
-            implementation_time = adjusted_complexity * base_unit
-
-        # Phase 3: Self Review (fixed time)
-        self_review_time = phases['self_review']['base_minutes']
-
-        # Phase 4: Testing (percentage of implementation)
-        testing_percentage = phases['testing']['percentage_of_implementation'] / 100.0
-        testing_time = implementation_time * testing_percentage
-
-        # Phase 5: Code Review & Revisions (scales with complexity)
-        code_review_base = phases['code_review']['base_minutes_at_complexity_5']
-        code_review_time = code_review_base * scale_factor
-
-        # Phase 6: Deployment to Test (fixed)
-        if has_infrastructure_changes:
-            deploy_time = phases['deployment_to_test']['infrastructure_changes_minutes']
-        else:
-            deploy_time = phases['deployment_to_test']['base_minutes']
-
-        # Phase 7: Verification (scales with complexity)
-        verification_base = phases['verification']['base_minutes_at_complexity_5']
-        verification_time = verification_base * scale_factor
-
-        # Total
-        total_minutes = (planning_time + implementation_time + self_review_time +
-                        testing_time + code_review_time + deploy_time + verification_time)
-
-        return {
-            'planning_design': round(planning_time, 1),
-            'implementation': round(implementation_time, 1),
-            'self_review': round(self_review_time, 1),
-            'testing': round(testing_time, 1),
-            'code_review': round(code_review_time, 1),
-            'deployment_to_test': round(deploy_time, 1),
-            'verification': round(verification_time, 1),
-            'total_minutes': round(total_minutes, 1),
-            'total_hours': round(total_minutes / 60.0, 2),
-            'phases': {
-                '1_planning_design': {
-                    'label': phases['planning_design']['label'],
-                    'description': phases['planning_design']['description'],
-                    'time_minutes': round(planning_time, 1),
-                    'scales_with_complexity': True
-                },
-                '2_implementation': {
-                    'label': phases['implementation']['label'],
-                    'description': phases['implementation']['description'],
-                    'time_minutes': round(implementation_time, 1),
-                    'scales_with_complexity': True,
-                    'task_type_base_unit': base_unit
-                },
-                '3_self_review': {
-                    'label': phases['self_review']['label'],
-                    'description': phases['self_review']['description'],
-                    'time_minutes': round(self_review_time, 1),
-                    'scales_with_complexity': False
-                },
-                '4_testing': {
-                    'label': phases['testing']['label'],
-                    'description': phases['testing']['description'],
-                    'time_minutes': round(testing_time, 1),
-                    'percentage_of_implementation': testing_percentage * 100
-                },
-                '5_code_review': {
-                    'label': phases['code_review']['label'],
-                    'description': phases['code_review']['description'],
-                    'time_minutes': round(code_review_time, 1),
-                    'scales_with_complexity': True
-                },
-                '6_deployment_to_test': {
-                    'label': phases['deployment_to_test']['label'],
-                    'description': phases['deployment_to_test']['description'],
-                    'time_minutes': round(deploy_time, 1),
-                    'infrastructure_changes': has_infrastructure_changes,
-                    'scales_with_complexity': False
-                },
-                '7_verification': {
-                    'label': phases['verification']['label'],
-                    'description': phases['verification']['description'],
-                    'time_minutes': round(verification_time, 1),
-                    'scales_with_complexity': True
-                }
-            }
-        }
+        # One dispatch lookup selects the project type's specialized
+        # closure (constants pre-bound at load time); it returns the phase
+        # times in schema order plus the per-call dynamic fields
+        times, dynamic = self._manual_times[project_type](
+            adjusted_complexity, scale_factor, self._base_unit[task_type],
+            self._impl_fixed[task_type], has_infrastructure_changes)
+        return self._build_workflow_result(
+            self._manual_schema[project_type], times, dynamic)
 
     def calculate_ai_assisted_workflow_time(self,
                                             project_type: str,
                                             task_type: str,
                                             adjusted_complexity: float,
                                             scale_factor: float,
-                                            manual_workflow: Dict[str, float],
-                                            has_infrastructure_changes: bool = False) -> Dict[str, float]:
+                                            manual_workflow: WorkflowResult,
+                                            has_infrastructure_changes: bool = False) -> WorkflowResult:
         """
         Calculate AI-assisted development workflow time breakdown.
 
@@ -497,200 +1177,17 @@ class TicketEstimator:
         7. AI Documentation
 
         Returns:
-            Dict with phase times in minutes and total
+            WorkflowResult with phase times in minutes and total
+            (as_dict() gives the classic nested-dict shape)
         """
-        project_config = self.config['project_types'][project_type]
-        ai_phases = project_config['ai_assisted_workflow']
-
-        # Handle test_automation project type with custom AI workflow
-        if project_type == 'test_automation':
-            # Phase 1: AI Test Planning (time savings from manual)
-            ai_test_planning_config = ai_phases['ai_test_planning']
-            savings_pct = ai_test_planning_config['time_savings_percentage'] / 100.0
-            ai_test_planning_time = manual_workflow['test_planning'] * (1 - savings_pct)
-
-            # Phase 2: AI Environment Setup (time savings from manual)
-            ai_environment_config = ai_phases['ai_environment_setup']
-            savings_pct = ai_environment_config['time_savings_percentage'] / 100.0
-            ai_environment_time = manual_workflow['environment_setup'] * (1 - savings_pct)
-
-            # Phase 3: AI Page Objects (time savings from manual)
-            ai_page_objects_config = ai_phases['ai_page_objects']
-            savings_pct = ai_page_objects_config['time_savings_percentage'] / 100.0
-            ai_page_objects_time = manual_workflow['page_objects'] * (1 - savings_pct)
-
-            # Phase 4: AI Implementation (time savings from manual)
-            ai_implementation_config = ai_phases['ai_implementation']
-            savings_pct = ai_implementation_config['time_savings_percentage'] / 100.0
-            ai_implementation_time = manual_workflow['implementation'] * (1 - savings_pct)
-
-            # Phase 5: AI Gherkin Integration (time savings from manual)
-            ai_gherkin_config = ai_phases['ai_gherkin']
-            savings_pct = ai_gherkin_config['time_savings_percentage'] / 100.0
-            ai_gherkin_time = manual_workflow['gherkin_integration'] * (1 - savings_pct)
-
-            # Phase 6: AI Testing & Evidence (time savings from manual)
-            ai_testing_config = ai_phases['ai_testing']
-            savings_pct = ai_testing_config['time_savings_percentage'] / 100.0
-            ai_testing_time = manual_workflow['testing'] * (1 - savings_pct)
-
-            # Phase 7: AI Documentation (time savings from manual)
-            ai_documentation_config = ai_phases['ai_documentation']
-            savings_pct = ai_documentation_config['time_savings_percentage'] / 100.0
-            ai_documentation_time = manual_workflow['documentation'] * (1 - savings_pct)
-
-            # Total
-            total_minutes = (ai_test_planning_time + ai_environment_time + ai_page_objects_time +
-                            ai_implementation_time + ai_gherkin_time + ai_testing_time + ai_documentation_time)
-
-            return {
-                'ai_test_planning': round(ai_test_planning_time, 1),
-                'ai_environment_setup': round(ai_environment_time, 1),
-                'ai_page_objects': round(ai_page_objects_time, 1),
-                'ai_implementation': round(ai_implementation_time, 1),
-                'ai_gherkin': round(ai_gherkin_time, 1),
-                'ai_testing': round(ai_testing_time, 1),
-                'ai_documentation': round(ai_documentation_time, 1),
-                'total_minutes': round(total_minutes, 1),
-                'total_hours': round(total_minutes / 60.0, 2),
-                'phases': {
-                    '1_ai_test_planning': {
-                        'label': ai_phases['ai_test_planning']['label'],
-                        'description': ai_phases['ai_test_planning']['description'],
-                        'time_minutes': round(ai_test_planning_time, 1),
-                        'time_savings_percentage': ai_phases['ai_test_planning']['time_savings_percentage']
-                    },
-                    '2_ai_environment_setup': {
-                        'label': ai_phases['ai_environment_setup']['label'],
-                        'description': ai_phases['ai_environment_setup']['description'],
-                        'time_minutes': round(ai_environment_time, 1),
-                        'time_savings_percentage': ai_phases['ai_environment_setup']['time_savings_percentage']
-                    },
-                    '3_ai_page_objects': {
-                        'label': ai_phases['ai_page_objects']['label'],
-                        'description': ai_phases['ai_page_objects']['description'],
-                        'time_minutes': round(ai_page_objects_time, 1),
-                        'time_savings_percentage': ai_phases['ai_page_objects']['time_savings_percentage']
-                    },
-                    '4_ai_implementation': {
-                        'label': ai_phases['ai_implementation']['label'],
-                        'description': ai_phases['ai_implementation']['description'],
-                        'time_minutes': round(ai_implementation_time, 1),
-                        'time_savings_percentage': ai_phases['ai_implementation']['time_savings_percentage']
-                    },
-                    '5_ai_gherkin': {
-                        'label': ai_phases['ai_gherkin']['label'],
-                        'description': ai_phases['ai_gherkin']['description'],
-                        'time_minutes': round(ai_gherkin_time, 1),
-                        'time_savings_percentage': ai_phases['ai_gherkin']['time_savings_percentage']
-                    },
-                    '6_ai_testing': {
-                        'label': ai_phases['ai_testing']['label'],
-                        'description': ai_phases['ai_testing']['description'],
-                        'time_minutes': round(ai_testing_time, 1),
-                        'time_savings_percentage': ai_phases['ai_testing']['time_savings_percentage']
-                    },
-                    '7_ai_documentation': {
-                        'label': ai_phases['ai_documentation']['label'],
-                        'description': ai_phases['ai_documentation']['description'],
-                        'time_minutes': round(ai_documentation_time, 1),
-                        'time_savings_percentage': ai_phases['ai_documentation']['time_savings_percentage']
-                    }
-                }
-            }
-
-        # Standard AI workflow for other project types
-        # Phase 1: AI Planning (time savings from manual planning)
-        ai_planning_config = ai_phases['ai_planning']
-        savings_pct = ai_planning_config['time_savings_percentage'] / 100.0
-        ai_planning_time = manual_workflow['planning_design'] * (1 - savings_pct)
-
-        # Phase 2: AI Implementation (time savings from manual implementation)
-        ai_impl_config = ai_phases['ai_implementation']
-        savings_pct = ai_impl_config['time_savings_percentage'] / 100.0
-        ai_implementation_time = manual_workflow['implementation'] * (1 - savings_pct)
-
-        # Phase 3: AI Review (fixed time)
-        ai_review_time = ai_phases['ai_review']['base_minutes']
-
-        # Phase 4: Human Review & Testing (percentage of manual self_review + testing)
-        human_review_config = ai_phases['human_review_testing']
-        testing_pct = human_review_config['manual_phase_testing_percentage'] / 100.0
-        self_review_pct = human_review_config['manual_phase_self_review_percentage'] / 100.0
-        human_review_testing_time = (manual_workflow['self_review'] * self_review_pct +
-                                      manual_workflow['testing'] * testing_pct)
-
-        # Phase 5: Iterations & Vibe Coding (scales with complexity)
-        iterations_config = ai_phases['iterations']
-        iterations_base = iterations_config['base_minutes_at_complexity_5']
-        iterations_time = iterations_base * scale_factor
-
-        # Phase 6: Deploy to Test (same as manual deployment)
-        deploy_time = manual_workflow['deployment_to_test']
-
-        # Phase 7: Test Verification (fixed or based on infra)
-        verification_config = ai_phases['test_verification']
-        if has_infrastructure_changes:
-            verification_time = verification_config['infrastructure_changes_minutes']
-        else:
-            verification_time = verification_config['base_minutes']
-
-        # Total
-        total_minutes = (ai_planning_time + ai_implementation_time + ai_review_time +
-                        human_review_testing_time + iterations_time + deploy_time + verification_time)
-
-        return {
-            'ai_planning': round(ai_planning_time, 1),
-            'ai_implementation': round(ai_implementation_time, 1),
-            'ai_review': round(ai_review_time, 1),
-            'human_review_testing': round(human_review_testing_time, 1),
-            'iterations': round(iterations_time, 1),
-            'deploy_test': round(deploy_time, 1),
-            'test_verification': round(verification_time, 1),
-            'total_minutes': round(total_minutes, 1),
-            'total_hours': round(total_minutes / 60.0, 2),
-            'phases': {
-                '1_ai_planning': {
-                    'label': ai_phases['ai_planning']['label'],
-                    'description': ai_phases['ai_planning']['description'],
-                    'time_minutes': round(ai_planning_time, 1),
-                    'time_savings_percentage': ai_phases['ai_planning']['time_savings_percentage']
-                },
-                '2_ai_implementation': {
-                    'label': ai_phases['ai_implementation']['label'],
-                    'description': ai_phases['ai_implementation']['description'],
-                    'time_minutes': round(ai_implementation_time, 1),
-                    'time_savings_percentage': ai_phases['ai_implementation']['time_savings_percentage']
-                },
-                '3_ai_review': {
-                    'label': ai_phases['ai_review']['label'],
-                    'description': ai_phases['ai_review']['description'],
-                    'time_minutes': round(ai_review_time, 1)
-                },
-                '4_human_review_testing': {
-                    'label': ai_phases['human_review_testing']['label'],
-                    'description': ai_phases['human_review_testing']['description'],
-                    'time_minutes': round(human_review_testing_time, 1)
-                },
-                '5_iterations': {
-                    'label': ai_phases['iterations']['label'],
-                    'description': ai_phases['iterations']['description'],
-                    'time_minutes': round(iterations_time, 1),
-                    'scales_with_complexity': True
-                },
-                '6_deploy_test': {
-                    'label': ai_phases['deploy_test']['label'],
-                    'description': ai_phases['deploy_test']['description'],
-                    'time_minutes': round(deploy_time, 1)
-                },
-                '7_test_verification': {
-                    'label': ai_phases['test_verification']['label'],
-                    'description': ai_phases['test_verification']['description'],
-                    'time_minutes': round(verification_time, 1),
-                    'infrastructure_changes': has_infrastructure_changes
-                }
-            }
-        }
+        # One dispatch lookup selects the project type's specialized
+        # closure (constants pre-bound at load time); it returns the phase
+        # times in schema order plus the per-call dynamic fields
+        times, dynamic = self._ai_times[project_type](
+            manual_workflow.flat_times, scale_factor,
+            has_infrastructure_changes)
+        return self._build_workflow_result(
+            self._ai_schema[project_type], times, dynamic)
 
     def apply_bucket_rounding(self, hours: float) -> Tuple[int, float]:
         """
@@ -699,30 +1196,24 @@ class TicketEstimator:
         Returns:
             Tuple of (rounded_hours, threshold_used)
         """
-        buckets = self.config['bucket_rounding']['buckets_hours']
-        thresholds = self.config['bucket_rounding']['thresholds']
-
-        # Find current bucket (largest bucket <= hours)
-        current_bucket = 0
-        for bucket in buckets:
-            if bucket <= hours:
-                current_bucket = bucket
-            else:
-                break
+        # Find current bucket (largest bucket <= hours) with one C-level
+        # binary search; index 0 is the implicit 0-hour bucket
+        idx = bisect.bisect_right(self._buckets_sorted, hours)
 
         # Check if we should round up
-        threshold_config = thresholds.get(str(current_bucket))
-        if threshold_config:
-            threshold = threshold_config['threshold']
+        threshold_config = self._thresholds_by_idx[idx]
+        if threshold_config is not None:
+            threshold, next_bucket = threshold_config
             if hours > threshold:
                 # Jump to next bucket
-                rounded = threshold_config['next']
-                return rounded, threshold
+                return next_bucket, threshold
+            # Stay at current bucket
+            return self._buckets_with_zero[idx], threshold
 
         # Stay at current bucket
-        return current_bucket, threshold_config['threshold'] if threshold_config else hours
+        return self._buckets_with_zero[idx], hours
 
-    def calculate_file_touch_overhead(self, file_count: int, raw_complexity: float) -> Dict:
+    def calculate_file_touch_overhead(self, file_count: int, raw_complexity: float) -> FileTouchOverhead:
         """
         Calculate overhead time for touching many files in manual development.
 
@@ -731,43 +1222,37 @@ class TicketEstimator:
             raw_complexity: Raw complexity score (0-10)
 
         Returns:
-            Dict with overhead details
+            FileTouchOverhead; calculation/details strings format lazily
+            on access, as_dict() gives the classic dict shape
         """
-        config = self.config.get('file_touch_overhead', {})
+        fto = self._fto
 
-        if not config.get('enabled', False):
-            return {
-                'enabled': False,
-                'overhead_minutes': 0,
-                'overhead_hours': 0,
-                'file_count': file_count,
-                'details': 'File touch overhead is disabled'
-            }
+        if not fto.enabled:
+            if file_count is None:
+                return self._fto_zero
+            return FileTouchOverhead(False, 0, 0, file_count)
 
-        if file_count is None or file_count < config.get('minimum_files_for_overhead', 20):
-            return {
-                'enabled': True,
-                'overhead_minutes': 0,
-                'overhead_hours': 0,
-                'file_count': file_count or 0,
-                'details': f'Below minimum threshold ({config.get("minimum_files_for_overhead", 20)} files)'
-            }
+        if file_count is None or file_count < fto.min_files:
+            # No file count given (or zero): the shared prepared record
+            # already carries exactly these field values
+            if not file_count:
+                return self._fto_zero
+            return FileTouchOverhead(True, 0, 0, file_count,
+                                     min_files=fto.min_files)
 
         # Get base time per file
-        base_time = config.get('base_time_per_file_minutes', 5)
+        base_time = fto.base_time
 
         # Calculate complexity multiplier
-        scaling_config = config.get('complexity_scaling', {})
-        if scaling_config.get('enabled', True):
-            thresholds = scaling_config.get('thresholds', {})
-            if raw_complexity < thresholds.get('low', 3.0):
-                multiplier = scaling_config.get('low_complexity_multiplier', 1.0)
+        if fto.scaling_enabled:
+            if raw_complexity < fto.low_threshold:
+                multiplier = fto.low_mult
                 complexity_level = 'low'
-            elif raw_complexity < thresholds.get('medium', 6.0):
-                multiplier = scaling_config.get('medium_complexity_multiplier', 1.5)
+            elif raw_complexity < fto.medium_threshold:
+                multiplier = fto.medium_mult
                 complexity_level = 'medium'
             else:
-                multiplier = scaling_config.get('high_complexity_multiplier', 1.8)
+                multiplier = fto.high_mult
                 complexity_level = 'high'
         else:
             multiplier = 1.0
@@ -777,42 +1262,20 @@ class TicketEstimator:
         overhead_minutes = file_count * base_time * multiplier
 
         # Apply maximum cap
-        max_overhead = config.get('maximum_overhead_minutes', 300)
+        max_overhead = fto.max_overhead
         if overhead_minutes > max_overhead:
             overhead_minutes = max_overhead
             capped = True
         else:
             capped = False
 
-        return {
-            'enabled': True,
-            'overhead_minutes': round(overhead_minutes, 1),
-            'overhead_hours': round(overhead_minutes / 60.0, 2),
-            'file_count': file_count,
-            'base_time_per_file': base_time,
-            'complexity_multiplier': multiplier,
-            'complexity_level': complexity_level,
-            'raw_complexity': raw_complexity,
-            'calculation': f'{file_count} files × {base_time} min × {multiplier} = {round(overhead_minutes, 1)} min',
-            'capped': capped,
-            'maximum_overhead': max_overhead if capped else None,
-            'details': f'{file_count} files with {complexity_level} complexity ({raw_complexity:.1f}/10)'
-        }
-
-    def _find_implementation_phase_key(self, phases: Dict) -> str:
-        """
-        Dynamically find the implementation phase key.
-
-        Args:
-            phases: Dict of workflow phases
-
-        Returns:
-            Phase key containing 'implementation'
-        """
-        for key in phases.keys():
-            if 'implementation' in key.lower():
-                return key
-        raise ValueError("No implementation phase found in workflow phases")
+        # overhead_minutes is rounded once here; the calculation property
+        # reuses the rounded field when it formats
+        return FileTouchOverhead(True, round(overhead_minutes, 1),
+                                 round(overhead_minutes / 60.0, 2),
+                                 file_count, base_time, multiplier,
+                                 complexity_level, raw_complexity, capped,
+                                 max_overhead if capped else None)
 
     def estimate_ticket(self,
                        title: str,
@@ -852,15 +1315,40 @@ class TicketEstimator:
             - Detected overhead activities
             - Manual time adjustments
             - Time savings analysis
+
+        Repeated calls with identical inputs return the memoized
+        breakdown (treat it as read-only).
         """
+        # Normalize the one unhashable argument; tuple(items()) keeps
+        # the caller's key order so the breakdown embeds the scores dict
+        # exactly as provided
+        scores_key = (None if complexity_scores is None
+                      else tuple(complexity_scores.items()))
+        return self._estimate_cached(title, description, project_type,
+                                     issue_type, scores_key,
+                                     task_type_override, team_velocity,
+                                     has_infrastructure_changes, file_count)
+
+    def _estimate_ticket_impl(self,
+                              title: str,
+                              description: str,
+                              project_type: str,
+                              issue_type: str,
+                              scores_key: Optional[Tuple],
+                              task_type_override: str,
+                              team_velocity: float,
+                              has_infrastructure_changes: bool,
+                              file_count: int) -> Dict:
+        """Uncached estimate_ticket body; keyed per ticket by the memo."""
+        complexity_scores = None if scores_key is None else dict(scores_key)
+
         # Use defaults if not provided
-        defaults = self.config.get('defaults', {})
         if project_type is None:
-            project_type = defaults.get('project_type', 'monolithic')
+            project_type = self._default_project_type
         if team_velocity is None:
-            team_velocity = defaults.get('team_velocity', 1.0)
+            team_velocity = self._default_team_velocity
         if has_infrastructure_changes is None:
-            has_infrastructure_changes = defaults.get('has_infrastructure_changes', False)
+            has_infrastructure_changes = self._default_has_infra
 
         # Classify task type
         if task_type_override:
@@ -891,20 +1379,8 @@ class TicketEstimator:
 
         # Enforce file_count for large scope
         if complexity_scores['scope_size'] >= 7 and (file_count is None or file_count == 0):
-            raise ValueError(
-                f"\n{'=' * 70}\n"
-                f"ERROR: High scope_size ({complexity_scores['scope_size']}/10) detected but file_count is missing!\n"
-                f"\n"
-                f"File touch overhead will be significantly underestimated.\n"
-                f"Please run repository reconnaissance to count affected files:\n"
-                f"  - Use Grep/Glob to find all files to be modified\n"
-                f"  - Count unique files across all searches\n"
-                f"  - Pass file_count parameter to estimate_ticket()\n"
-                f"\n"
-                f"Impact: For large refactors (50-100+ files), this can add 2-5 hours\n"
-                f"to the manual workflow estimate.\n"
-                f"{'=' * 70}\n"
-            )
+            raise ValueError(_FILE_COUNT_ERROR.format(
+                scope_size=complexity_scores['scope_size']))
 
         # Get sizing
         t_shirt_size = self.get_t_shirt_size(adjusted_complexity)
@@ -915,28 +1391,31 @@ class TicketEstimator:
             project_type, task_type, adjusted_complexity, scale_factor, has_infrastructure_changes
         )
 
-        # Calculate file touch overhead (manual development only)
-        file_touch_overhead = self.calculate_file_touch_overhead(file_count, raw_complexity)
+        # Calculate file touch overhead (manual development only); the
+        # result is embedded in the output, so the dict (and its human-
+        # readable strings) materializes once right here
+        file_touch_overhead = self.calculate_file_touch_overhead(
+            file_count, raw_complexity).as_dict()
 
         # Add file touch overhead to manual workflow implementation time
         if file_touch_overhead['overhead_minutes'] > 0:
-            manual_workflow['implementation'] += file_touch_overhead['overhead_minutes']
-            manual_workflow['total_minutes'] += file_touch_overhead['overhead_minutes']
-            manual_workflow['total_hours'] = round(manual_workflow['total_minutes'] / 60.0, 2)
-            # Find implementation phase dynamically
-            impl_phase_key = self._find_implementation_phase_key(manual_workflow['phases'])
-            manual_workflow['phases'][impl_phase_key]['time_minutes'] += file_touch_overhead['overhead_minutes']
-            manual_workflow['phases'][impl_phase_key]['file_touch_overhead'] = file_touch_overhead
-
-        # Detect overhead activities
-        overhead_activities = self.detect_overhead_activities(title, description, task_type, project_type=project_type, files_involved=None)
-
-        # Calculate total overhead time
-        overhead_minutes = sum(activity['additional_minutes'] for activity in overhead_activities)
+            fto_minutes = file_touch_overhead['overhead_minutes']
+            manual_workflow.flat_times['implementation'] += fto_minutes
+            manual_workflow.total_minutes += fto_minutes
+            manual_workflow.total_hours = round(manual_workflow.total_minutes / 60.0, 2)
+            # Implementation phase key precomputed per project type
+            impl_phase = manual_workflow.phases[self._impl_phase_key[project_type]]
+            impl_phase.time_minutes += fto_minutes
+            impl_phase.file_touch_overhead = file_touch_overhead
+
+        # Detect overhead activities (the total comes back from the same
+        # pass that builds the list)
+        overhead_activities, overhead_minutes = self.detect_overhead_activities(
+            title, description, task_type, project_type=project_type, files_involved=None)
         overhead_hours = overhead_minutes / 60.0
 
         # Add overhead to workflow total
-        total_with_overhead = manual_workflow['total_hours'] + overhead_hours
+        total_with_overhead = manual_workflow.total_hours + overhead_hours
 
         # Apply bucket rounding (on total including overhead)
         rounded_hours, rounding_threshold = self.apply_bucket_rounding(total_with_overhead)
@@ -952,7 +1431,7 @@ class TicketEstimator:
         )
 
         # Add overhead to AI-assisted total (same overhead applies)
-        ai_total_with_overhead = ai_assisted_workflow['total_hours'] + overhead_hours
+        ai_total_with_overhead = ai_assisted_workflow.total_hours + overhead_hours
 
         # Apply bucket rounding to AI-assisted total
         ai_rounded_hours, ai_rounding_threshold = self.apply_bucket_rounding(ai_total_with_overhead)
@@ -961,43 +1440,49 @@ class TicketEstimator:
         time_savings_hours = total_with_overhead - ai_total_with_overhead
         time_savings_percentage = (time_savings_hours / total_with_overhead * 100) if total_with_overhead > 0 else 0
 
+        # Local round alias (LOAD_FAST instead of LOAD_GLOBAL for the ~10
+        # calls below); the manual total appears in two sections, so round
+        # it once
+        _round = round
+        manual_total_rounded = _round(total_with_overhead, 2)
+
         return {
             'project_type': project_type,
-            'project_type_label': self.config['project_types'][project_type]['label'],
+            'project_type_label': self._pt_label[project_type],
             'task_type': task_type,
-            'task_type_label': self.config['task_types'][task_type]['label'],
+            'task_type_label': self._tt_label[task_type],
             'file_touch_overhead': file_touch_overhead,
             'task_type_reasons': task_type_reasons,
             't_shirt_size': t_shirt_size,
             'story_points': story_points,
-            'raw_complexity': round(raw_complexity, 2),
-            'adjusted_complexity': round(adjusted_complexity, 2),
-            'scale_factor': round(scale_factor, 3),
+            'raw_complexity': _round(raw_complexity, 2),
+            'adjusted_complexity': _round(adjusted_complexity, 2),
+            'scale_factor': _round(scale_factor, 3),
             'complexity_scores': complexity_scores,
             'manual_workflow': {
-                **manual_workflow,
+                **manual_workflow.as_dict(),
                 'total_hours_rounded': rounded_hours,
                 'rounding_threshold': rounding_threshold
             },
             'ai_assisted_workflow': {
-                **ai_assisted_workflow,
+                **ai_assisted_workflow.as_dict(),
                 'total_hours_rounded': ai_rounded_hours,
                 'rounding_threshold': ai_rounding_threshold
             },
             'time_savings': {
-                'hours': round(time_savings_hours, 2),
-                'percentage': round(time_savings_percentage, 1),
-                'manual_total': round(total_with_overhead, 2),
-                'ai_assisted_total': round(ai_total_with_overhead, 2)
+                'hours': _round(time_savings_hours, 2),
+                'percentage': _round(time_savings_percentage, 1),
+                'manual_total': manual_total_rounded,
+                'ai_assisted_total': _round(ai_total_with_overhead, 2)
             },
             'overhead_activities': {
                 'detected': overhead_activities,
-                'total_overhead_minutes': round(overhead_minutes, 1),
-                'total_overhead_hours': round(overhead_hours, 2),
+                'total_overhead_minutes': _round(overhead_minutes, 1),
+                'total_overhead_hours': _round(overhead_hours, 2),
                 'count': len(overhead_activities)
             },
             'total_including_overhead': {
-                'total_hours_calculated': round(total_with_overhead, 2),
+                'total_hours_calculated': manual_total_rounded,
                 'total_hours_rounded': rounded_hours,
                 'rounding_threshold': rounding_threshold
             },
@@ -1005,213 +1490,31 @@ class TicketEstimator:
             'has_infrastructure_changes': has_infrastructure_changes
         }
 
+    def estimate_many(self, tickets: List[Dict]) -> List[Dict]:
+        """
+        Estimate a whole batch of tickets (e.g. a backlog import).
+
+        Args:
+            tickets: List of dicts of estimate_ticket keyword arguments
+                     (title, description, project_type, complexity_scores,
+                     ...)
+
+        Returns:
+            List of complete estimation breakdowns, in input order
+
+        All per-instance preparation (keyword tables, flattened parameter
+        structs, schemas) is shared across the batch, so the per-ticket
+        cost is just the scoring arithmetic and result assembly. The
+        numeric stages already run against precomputed tables — bucket
+        rounding and sizing are single C-level bisect calls per ticket —
+        so there is no interpreted re-derivation to amortize further.
+        """
+        estimate = self.estimate_ticket  # Bind once outside the loop
+        return [estimate(**ticket) for ticket in tickets]
+
 
-# Example usage
+# Example usage lives in estimator_demo.py so importing this module does
+# not load the demo's code objects
 if __name__ == '__main__':
-    estimator = TicketEstimator('heuristics.json')
-
-    print("\n" + "=" * 70)
-    print("JIRA TICKET ESTIMATOR - MANUAL DEV WORKFLOW")
-    print("=" * 70)
-
-    # Example 1: Bug Fix - Monolithic
-    print("\n" + "=" * 70)
-    print("Example 1: Bug Fix - Monolithic (Laravel)")
-    print("=" * 70)
-    result = estimator.estimate_ticket(
-        title="Fix validation error on login form",
-        description="The login form is not properly validating email addresses",
-        project_type="monolithic",
-        issue_type="Bug",
-        complexity_scores={
-            'scope_size': 2,
-            'technical_complexity': 2,
-            'testing_requirements': 4,
-            'risk_and_unknowns': 2,
-            'dependencies': 3
-        }
-    )
-
-    print(f"Project Type: {result['project_type_label']}")
-    print(f"Task Type: {result['task_type_label']}")
-    print(f"T-Shirt Size: {result['t_shirt_size']}")
-    print(f"Story Points: {result['story_points']}")
-    print(f"Complexity: {result['raw_complexity']}/10 raw → {result['adjusted_complexity']}/10 adjusted")
-    print(f"Scale Factor: {result['scale_factor']}")
-    print("\nManual Development Time Breakdown:")
-    workflow = result['manual_workflow']
-    print(f"  1. Planning & Design:        {workflow['planning_design']:6.1f} min ({workflow['planning_design']/60:.2f}h)")
-    print(f"  2. Implementation:           {workflow['implementation']:6.1f} min ({workflow['implementation']/60:.2f}h)")
-    print(f"  3. Self Review:              {workflow['self_review']:6.1f} min ({workflow['self_review']/60:.2f}h)")
-    print(f"  4. Testing:                  {workflow['testing']:6.1f} min ({workflow['testing']/60:.2f}h)")
-    print(f"  5. Code Review & Revisions:  {workflow['code_review']:6.1f} min ({workflow['code_review']/60:.2f}h)")
-    print(f"  6. Deployment to Test:       {workflow['deployment_to_test']:6.1f} min ({workflow['deployment_to_test']/60:.2f}h)")
-    print(f"  7. Verification:             {workflow['verification']:6.1f} min ({workflow['verification']/60:.2f}h)")
-    print(f"  {'─' * 50}")
-    print(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
-    print(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
-
-    # Example 2: Refactor - Serverless
-    print("\n" + "=" * 70)
-    print("Example 2: Refactor - Serverless (AWS Lambda)")
-    print("=" * 70)
-    result = estimator.estimate_ticket(
-        title="Optimize Lambda cold start and improve DynamoDB query patterns",
-        description="Reduce cold start time and optimize DynamoDB query patterns",
-        project_type="serverless",
-        complexity_scores={
-            'scope_size': 5,
-            'technical_complexity': 6,
-            'testing_requirements': 6,
-            'risk_and_unknowns': 5,
-            'dependencies': 6
-        }
-    )
-
-    print(f"Project Type: {result['project_type_label']}")
-    print(f"Task Type: {result['task_type_label']}")
-    print(f"T-Shirt Size: {result['t_shirt_size']}")
-    print(f"Story Points: {result['story_points']}")
-    print(f"Complexity: {result['raw_complexity']}/10 raw → {result['adjusted_complexity']}/10 adjusted")
-    print(f"Scale Factor: {result['scale_factor']}")
-    print("\nManual Development Time Breakdown:")
-    workflow = result['manual_workflow']
-    print(f"  1. Planning & Design:        {workflow['planning_design']:6.1f} min ({workflow['planning_design']/60:.2f}h)")
-    print(f"  2. Implementation:           {workflow['implementation']:6.1f} min ({workflow['implementation']/60:.2f}h)")
-    print(f"  3. Self Review:              {workflow['self_review']:6.1f} min ({workflow['self_review']/60:.2f}h)")
-    print(f"  4. Testing:                  {workflow['testing']:6.1f} min ({workflow['testing']/60:.2f}h)")
-    print(f"  5. Code Review & Revisions:  {workflow['code_review']:6.1f} min ({workflow['code_review']/60:.2f}h)")
-    print(f"  6. Deployment to Test:       {workflow['deployment_to_test']:6.1f} min ({workflow['deployment_to_test']/60:.2f}h)")
-    print(f"  7. Verification:             {workflow['verification']:6.1f} min ({workflow['verification']/60:.2f}h)")
-    print(f"  {'─' * 50}")
-    print(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
-    print(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
-
-    # Example 3: Net-New Feature - Frontend
-    print("\n" + "=" * 70)
-    print("Example 3: Net-New Feature - Frontend (React)")
-    print("=" * 70)
-    result = estimator.estimate_ticket(
-        title="Create new dashboard widget with real-time data",
-        description="Build a new widget component that displays real-time metrics",
-        project_type="frontend",
-        complexity_scores={
-            'scope_size': 4,
-            'technical_complexity': 4,
-            'testing_requirements': 4,
-            'risk_and_unknowns': 4,
-            'dependencies': 4
-        }
-    )
-
-    print(f"Project Type: {result['project_type_label']}")
-    print(f"Task Type: {result['task_type_label']}")
-    print(f"T-Shirt Size: {result['t_shirt_size']}")
-    print(f"Story Points: {result['story_points']}")
-    print(f"Complexity: {result['raw_complexity']}/10 raw → {result['adjusted_complexity']}/10 adjusted")
-    print(f"Scale Factor: {result['scale_factor']}")
-    print("\nManual Development Time Breakdown:")
-    workflow = result['manual_workflow']
-    print(f"  1. Planning & Design:        {workflow['planning_design']:6.1f} min ({workflow['planning_design']/60:.2f}h)")
-    print(f"  2. Implementation:           {workflow['implementation']:6.1f} min ({workflow['implementation']/60:.2f}h)")
-    print(f"  3. Self Review:              {workflow['self_review']:6.1f} min ({workflow['self_review']/60:.2f}h)")
-    print(f"  4. Testing:                  {workflow['testing']:6.1f} min ({workflow['testing']/60:.2f}h)")
-    print(f"  5. Code Review & Revisions:  {workflow['code_review']:6.1f} min ({workflow['code_review']/60:.2f}h)")
-    print(f"  6. Deployment to Test:       {workflow['deployment_to_test']:6.1f} min ({workflow['deployment_to_test']/60:.2f}h)")
-    print(f"  7. Verification:             {workflow['verification']:6.1f} min ({workflow['verification']/60:.2f}h)")
-    print(f"  {'─' * 50}")
-    print(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
-    print(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
-
-    # Example 4: Enhancement - Full-Stack with infrastructure changes
-    print("\n" + "=" * 70)
-    print("Example 4: Enhancement - Full-Stack (with infra changes)")
-    print("=" * 70)
-    result = estimator.estimate_ticket(
-        title="Add user notifications system with email + SMS + in-app alerts",
-        description="Implement comprehensive notification system across all channels",
-        project_type="fullstack",
-        complexity_scores={
-            'scope_size': 8,
-            'technical_complexity': 7,
-            'testing_requirements': 8,
-            'risk_and_unknowns': 7,
-            'dependencies': 8
-        },
-        has_infrastructure_changes=True
-    )
-
-    print(f"Project Type: {result['project_type_label']}")
-    print(f"Task Type: {result['task_type_label']}")
-    print(f"T-Shirt Size: {result['t_shirt_size']}")
-    print(f"Story Points: {result['story_points']}")
-    print(f"Complexity: {result['raw_complexity']}/10 raw → {result['adjusted_complexity']}/10 adjusted")
-    print(f"Scale Factor: {result['scale_factor']}")
-    print(f"Infrastructure Changes: {result['has_infrastructure_changes']}")
-    print("\nManual Development Time Breakdown:")
-    workflow = result['manual_workflow']
-    print(f"  1. Planning & Design:        {workflow['planning_design']:6.1f} min ({workflow['planning_design']/60:.2f}h)")
-    print(f"  2. Implementation:           {workflow['implementation']:6.1f} min ({workflow['implementation']/60:.2f}h)")
-    print(f"  3. Self Review:              {workflow['self_review']:6.1f} min ({workflow['self_review']/60:.2f}h)")
-    print(f"  4. Testing:                  {workflow['testing']:6.1f} min ({workflow['testing']/60:.2f}h)")
-    print(f"  5. Code Review & Revisions:  {workflow['code_review']:6.1f} min ({workflow['code_review']/60:.2f}h)")
-    print(f"  6. Deployment to Test:       {workflow['deployment_to_test']:6.1f} min ({workflow['deployment_to_test']/60:.2f}h) [with infra]")
-    print(f"  7. Verification:             {workflow['verification']:6.1f} min ({workflow['verification']/60:.2f}h)")
-    print(f"  {'─' * 50}")
-    print(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
-    print(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
-
-    # Example 5: Enhancement with Database Changes - Overhead Detection
-    print("\n" + "=" * 70)
-    print("Example 5: Enhancement with DB Changes - Monolithic")
-    print("=" * 70)
-    result = estimator.estimate_ticket(
-        title="Add user preferences table with migration",
-        description="Create new user_preferences table to store user settings. Need database migration to create table with columns: user_id, preference_key, preference_value, created_at, updated_at. Add index on user_id.",
-        project_type="monolithic",
-        complexity_scores={
-            'scope_size': 4,
-            'technical_complexity': 3,
-            'testing_requirements': 4,
-            'risk_and_unknowns': 3,
-            'dependencies': 4
-        }
-    )
-
-    print(f"Project Type: {result['project_type_label']}")
-    print(f"Task Type: {result['task_type_label']}")
-    print(f"T-Shirt Size: {result['t_shirt_size']}")
-    print(f"Story Points: {result['story_points']}")
-    print(f"Complexity: {result['raw_complexity']}/10 raw → {result['adjusted_complexity']}/10 adjusted")
-    print(f"Scale Factor: {result['scale_factor']}")
-    print("\nManual Development Time Breakdown:")
-    workflow = result['manual_workflow']
-    print(f"  1. Planning & Design:        {workflow['planning_design']:6.1f} min ({workflow['planning_design']/60:.2f}h)")
-    print(f"  2. Implementation:           {workflow['implementation']:6.1f} min ({workflow['implementation']/60:.2f}h)")
-    print(f"  3. Self Review:              {workflow['self_review']:6.1f} min ({workflow['self_review']/60:.2f}h)")
-    print(f"  4. Testing:                  {workflow['testing']:6.1f} min ({workflow['testing']/60:.2f}h)")
-    print(f"  5. Code Review & Revisions:  {workflow['code_review']:6.1f} min ({workflow['code_review']/60:.2f}h)")
-    print(f"  6. Deployment to Test:       {workflow['deployment_to_test']:6.1f} min ({workflow['deployment_to_test']/60:.2f}h)")
-    print(f"  7. Verification:             {workflow['verification']:6.1f} min ({workflow['verification']/60:.2f}h)")
-    print(f"  {'─' * 50}")
-    print(f"  Subtotal (workflow):         {workflow['total_hours']:.2f}h")
-
-    # Show overhead activities
-    overhead = result['overhead_activities']
-    if overhead['count'] > 0:
-        print(f"\nOverhead Activities Detected: {overhead['count']}")
-        for activity in overhead['detected']:
-            print(f"  • {activity['label']}: +{activity['additional_minutes']} min")
-            print(f"    Reason: {activity['rationale']}")
-            if activity['matched_keywords']:
-                print(f"    Keywords: {', '.join(activity['matched_keywords'])}")
-        print(f"  Total Overhead: {overhead['total_overhead_minutes']} min ({overhead['total_overhead_hours']}h)")
-
-    totals = result['total_including_overhead']
-    print(f"\n  {'─' * 50}")
-    print(f"  TOTAL (with overhead):       {totals['total_hours_calculated']:.2f}h")
-    print(f"  TOTAL (rounded to bucket):   {totals['total_hours_rounded']}h")
-
-    print("\n" + "=" * 70)
-    print("END OF EXAMPLES")
-    print("=" * 70 + "\n")
+    from estimator_demo import main
+    main()
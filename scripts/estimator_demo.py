@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Jira Ticket Estimator - Demo Examples
+
+Runs five example estimations against heuristics.json and prints the
+manual-workflow breakdowns. Kept out of estimator.py so importing the
+estimator does not pay for parsing this output code.
+
+Each example is collected into a line list and emitted with a single
+print, so the run issues a handful of writes instead of one per line.
+
+Usage:
+    python3 estimator_demo.py
+"""
+
+from estimator import TicketEstimator
+
+_SEP = '=' * 70
+_RULE = f"  {'─' * 50}"
+
+
+def _header(title):
+    """Emit an example banner (before the estimate runs, so a failing
+    example still shows which one was in flight)."""
+    print('\n' + _SEP + '\n' + title + '\n' + _SEP)
+
+
+def _summary_lines(result):
+    """Shared per-example summary block."""
+    return [
+        f"Project Type: {result['project_type_label']}",
+        f"Task Type: {result['task_type_label']}",
+        f"T-Shirt Size: {result['t_shirt_size']}",
+        f"Story Points: {result['story_points']}",
+        f"Complexity: {result['raw_complexity']}/10 raw → {result['adjusted_complexity']}/10 adjusted",
+        f"Scale Factor: {result['scale_factor']}",
+    ]
+
+
+def _breakdown_lines(workflow, deploy_suffix=''):
+    """Shared seven-phase manual-workflow block."""
+    return [
+        '',
+        'Manual Development Time Breakdown:',
+        f"  1. Planning & Design:        {workflow['planning_design']:6.1f} min ({workflow['planning_design']/60:.2f}h)",
+        f"  2. Implementation:           {workflow['implementation']:6.1f} min ({workflow['implementation']/60:.2f}h)",
+        f"  3. Self Review:              {workflow['self_review']:6.1f} min ({workflow['self_review']/60:.2f}h)",
+        f"  4. Testing:                  {workflow['testing']:6.1f} min ({workflow['testing']/60:.2f}h)",
+        f"  5. Code Review & Revisions:  {workflow['code_review']:6.1f} min ({workflow['code_review']/60:.2f}h)",
+        f"  6. Deployment to Test:       {workflow['deployment_to_test']:6.1f} min ({workflow['deployment_to_test']/60:.2f}h){deploy_suffix}",
+        f"  7. Verification:             {workflow['verification']:6.1f} min ({workflow['verification']/60:.2f}h)",
+        _RULE,
+    ]
+
+
+def main():
+    estimator = TicketEstimator('heuristics.json')
+
+    _header('JIRA TICKET ESTIMATOR - MANUAL DEV WORKFLOW')
+
+    # Example 1: Bug Fix - Monolithic
+    _header('Example 1: Bug Fix - Monolithic (Laravel)')
+    result = estimator.estimate_ticket(
+        title="Fix validation error on login form",
+        description="The login form is not properly validating email addresses",
+        project_type="monolithic",
+        issue_type="Bug",
+        complexity_scores={
+            'scope_size': 2,
+            'technical_complexity': 2,
+            'testing_requirements': 4,
+            'risk_and_unknowns': 2,
+            'dependencies': 3
+        }
+    )
+
+    workflow = result['manual_workflow']
+    lines = _summary_lines(result)
+    lines += _breakdown_lines(workflow)
+    lines.append(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
+    lines.append(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
+    print('\n'.join(lines))
+
+    # Example 2: Refactor - Serverless
+    _header('Example 2: Refactor - Serverless (AWS Lambda)')
+    result = estimator.estimate_ticket(
+        title="Optimize Lambda cold start and improve DynamoDB query patterns",
+        description="Reduce cold start time and optimize DynamoDB query patterns",
+        project_type="serverless",
+        complexity_scores={
+            'scope_size': 5,
+            'technical_complexity': 6,
+            'testing_requirements': 6,
+            'risk_and_unknowns': 5,
+            'dependencies': 6
+        }
+    )
+
+    workflow = result['manual_workflow']
+    lines = _summary_lines(result)
+    lines += _breakdown_lines(workflow)
+    lines.append(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
+    lines.append(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
+    print('\n'.join(lines))
+
+    # Example 3: Net-New Feature - Frontend
+    _header('Example 3: Net-New Feature - Frontend (React)')
+    result = estimator.estimate_ticket(
+        title="Create new dashboard widget with real-time data",
+        description="Build a new widget component that displays real-time metrics",
+        project_type="frontend",
+        complexity_scores={
+            'scope_size': 4,
+            'technical_complexity': 4,
+            'testing_requirements': 4,
+            'risk_and_unknowns': 4,
+            'dependencies': 4
+        }
+    )
+
+    workflow = result['manual_workflow']
+    lines = _summary_lines(result)
+    lines += _breakdown_lines(workflow)
+    lines.append(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
+    lines.append(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
+    print('\n'.join(lines))
+
+    # Example 4: Enhancement - Full-Stack with infrastructure changes
+    _header('Example 4: Enhancement - Full-Stack (with infra changes)')
+    result = estimator.estimate_ticket(
+        title="Add user notifications system with email + SMS + in-app alerts",
+        description="Implement comprehensive notification system across all channels",
+        project_type="fullstack",
+        complexity_scores={
+            'scope_size': 8,
+            'technical_complexity': 7,
+            'testing_requirements': 8,
+            'risk_and_unknowns': 7,
+            'dependencies': 8
+        },
+        has_infrastructure_changes=True
+    )
+
+    workflow = result['manual_workflow']
+    lines = _summary_lines(result)
+    lines.append(f"Infrastructure Changes: {result['has_infrastructure_changes']}")
+    lines += _breakdown_lines(workflow, deploy_suffix=' [with infra]')
+    lines.append(f"  Total (calculated):          {workflow['total_hours']:.2f}h")
+    lines.append(f"  Total (rounded to bucket):   {workflow['total_hours_rounded']}h")
+    print('\n'.join(lines))
+
+    # Example 5: Enhancement with Database Changes - Overhead Detection
+    _header('Example 5: Enhancement with DB Changes - Monolithic')
+    result = estimator.estimate_ticket(
+        title="Add user preferences table with migration",
+        description="Create new user_preferences table to store user settings. Need database migration to create table with columns: user_id, preference_key, preference_value, created_at, updated_at. Add index on user_id.",
+        project_type="monolithic",
+        complexity_scores={
+            'scope_size': 4,
+            'technical_complexity': 3,
+            'testing_requirements': 4,
+            'risk_and_unknowns': 3,
+            'dependencies': 4
+        }
+    )
+
+    workflow = result['manual_workflow']
+    lines = _summary_lines(result)
+    lines += _breakdown_lines(workflow)
+    lines.append(f"  Subtotal (workflow):         {workflow['total_hours']:.2f}h")
+
+    # Show overhead activities
+    overhead = result['overhead_activities']
+    if overhead['count'] > 0:
+        lines += ['', f"Overhead Activities Detected: {overhead['count']}"]
+        for activity in overhead['detected']:
+            lines.append(f"  • {activity['label']}: +{activity['additional_minutes']} min")
+            lines.append(f"    Reason: {activity['rationale']}")
+            if activity['matched_keywords']:
+                lines.append(f"    Keywords: {', '.join(activity['matched_keywords'])}")
+        lines.append(f"  Total Overhead: {overhead['total_overhead_minutes']} min ({overhead['total_overhead_hours']}h)")
+
+    totals = result['total_including_overhead']
+    lines += ['', _RULE,
+              f"  TOTAL (with overhead):       {totals['total_hours_calculated']:.2f}h",
+              f"  TOTAL (rounded to bucket):   {totals['total_hours_rounded']}h"]
+    print('\n'.join(lines))
+
+    print('\n' + _SEP + '\nEND OF EXAMPLES\n' + _SEP + '\n')
+
+
+if __name__ == '__main__':
+    main()